@@ -736,16 +736,22 @@ export class GuidelinesExecutor extends EventEmitter {
   private generateNextActions(priorityIssues: Issue[], riskAssessment: Record<string, unknown>): string[] {
     const actions: string[] = [];
 
+    // Count critical and high issues in a single pass
+    let criticalCount = 0;
+    let highCount = 0;
+    for (const issue of priorityIssues) {
+      if (issue.severity === 'critical') criticalCount++;
+      else if (issue.severity === 'high') highCount++;
+    }
+
     // Actions for critical issues
-    const criticalIssues = priorityIssues.filter((issue: Issue) => issue.severity === 'critical');
-    if (criticalIssues.length > 0) {
-      actions.push(`Address ${criticalIssues.length} critical issues before merge`);
+    if (criticalCount > 0) {
+      actions.push(`Address ${criticalCount} critical issues before merge`);
     }
 
     // Actions for high issues
-    const highIssues = priorityIssues.filter((issue: Issue) => issue.severity === 'high');
-    if (highIssues.length > 0) {
-      actions.push(`Resolve ${highIssues.length} high-priority issues`);
+    if (highCount > 0) {
+      actions.push(`Resolve ${highCount} high-priority issues`);
     }
 
     // Risk-based actions
@@ -769,11 +775,14 @@ export class GuidelinesExecutor extends EventEmitter {
    * Calculate overall priority
    */
   private calculateOverallPriority(classification: ClassificationResult): string {
-    const criticalCount = classification.priorityIssues.filter((issue: Issue) => issue.severity === 'critical').length;
-    const highCount = classification.priorityIssues.filter((issue: Issue) => issue.severity === 'high').length;
+    // A critical issue decides the result, so stop scanning at the first one
+    let hasHighIssue = false;
+    for (const issue of classification.priorityIssues) {
+      if (issue.severity === 'critical') return 'critical';
+      if (issue.severity === 'high') hasHighIssue = true;
+    }
 
-    if (criticalCount > 0) return 'critical';
-    if (highCount > 0) return 'high';
+    if (hasHighIssue) return 'high';
     if (classification.riskAssessment['security'] === 'high') return 'high';
     if (classification.priorityIssues.length > 0) return 'medium';
     return 'low';
@@ -1036,6 +1045,12 @@ export class GuidelinesExecutor extends EventEmitter {
     execution.performance.tokenUsage.total =
       execution.performance.tokenUsage.inspector + execution.performance.tokenUsage.orchestrator;
 
+    // Tally step outcomes in a single pass
+    const stepCounts = new Map<string, number>();
+    for (const step of execution.steps) {
+      stepCounts.set(step.status, (stepCounts.get(step.status) ?? 0) + 1);
+    }
+
     // Create result
     execution.result = {
       success: true,
@@ -1048,9 +1063,9 @@ export class GuidelinesExecutor extends EventEmitter {
       artifacts: execution.steps.flatMap(step => step.artifacts),
       summary: {
         totalSteps: execution.steps.length,
-        completedSteps: execution.steps.filter(step => step.status === 'completed').length,
-        failedSteps: execution.steps.filter(step => step.status === 'failed').length,
-        skippedSteps: execution.steps.filter(step => step.status === 'skipped').length,
+        completedSteps: stepCounts.get('completed') ?? 0,
+        failedSteps: stepCounts.get('failed') ?? 0,
+        skippedSteps: stepCounts.get('skipped') ?? 0,
         totalDuration: execution.performance.totalDuration,
         tokenCost: execution.performance.tokenUsage.total
       }
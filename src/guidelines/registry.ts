@@ -33,7 +33,7 @@ import {
   Validator,
   AgentRole
 } from '../shared';
-import { configManager, PRPConfig } from '../shared/config';
+import { configManager } from '../shared/config';
 
 // Interface for GitHub agent with credentials
 interface GitHubAgentConfig {
@@ -6,6 +6,7 @@
 
 import { readFileSync } from 'fs';
 import { join, resolve } from 'path';
+import { LRUCache } from 'lru-cache';
 
 // For now, use a relative path approach
 const __dirname = resolve('.');
@@ -25,17 +26,147 @@ interface ExtendedGuidelineConfig extends GuidelineConfig {
   lastModified?: Date;
 }
 
+/** Signal urgency by minimum priority, highest threshold first */
+const URGENCY_THRESHOLDS: ReadonlyArray<readonly [number, string]> = [
+  [9, 'critical'],
+  [7, 'high'],
+  [5, 'medium']
+];
+
+/** Distinct raw signal texts whose pattern analysis is kept */
+const MAX_PATTERN_ANALYSIS_CACHE_SIZE = 500;
+
+/** Heading prepended to adapted guidelines that do not start with one */
+const GUIDELINE_HEADER = '## SIGNAL ANALYSIS GUIDELINE';
+
+/** Token optimization hints inserted before each guideline subsection */
+const TOKEN_HINTS: readonly string[] = [
+  '<!-- TOKEN_HINT: Focus on key decision points -->',
+  '<!-- TOKEN_HINT: Prioritize actionable recommendations -->',
+  '<!-- TOKEN_HINT: Limit historical examples to 2-3 most relevant -->'
+];
+
+const SUBSECTION_BREAK = /\n\n### /g;
+
+/** LLM priority markers for the priorities that have one */
+const PRIORITY_MARKERS: ReadonlyMap<number, string> = new Map([
+  [9, '<!-- PRIORITY: CRITICAL - Immediate processing required -->'],
+  [7, '<!-- PRIORITY: HIGH - Process with urgency -->'],
+  [5, '<!-- PRIORITY: MEDIUM - Standard processing -->'],
+  [3, '<!-- PRIORITY: LOW - Can be deferred -->']
+]);
+
+/**
+ * Index signal codes by category. Groups are listed in precedence order,
+ * so a code listed under several categories resolves to the first one.
+ */
+function buildCategoryIndex(groups: ReadonlyArray<readonly [string, readonly string[]]>): ReadonlyMap<string, string> {
+  const index = new Map<string, string>();
+  for (const [category, codes] of groups) {
+    for (const code of codes) {
+      if (!index.has(code)) {
+        index.set(code, category);
+      }
+    }
+  }
+  return index;
+}
+
+/** Fallback categories used to match guidelines by name */
+const GUIDELINE_CATEGORY_BY_SIGNAL = buildCategoryIndex([
+  ['orchestrator', ['oa', 'os', 'op', 'or']],
+  ['admin', ['ap', 'av', 'af', 'as']],
+  ['orchestrator-action', ['od', 'oc', 'or', 'oe', 'oa']],
+  ['admin-action', ['ad', 'ae', 'as', 'aa']],
+  ['testing', ['tt', 'te', 'ti', 'ta', 'td']],
+  ['quality', ['qb', 'qp', 'pc']]
+]);
+
+/** Categories reported in enhanced signal context */
+const CONTEXT_CATEGORY_BY_SIGNAL = buildCategoryIndex([
+  ['development', ['dp', 'tp', 'bf', 'br', 'no', 'bb', 'af', 'rr', 'rc', 'da', 'vp', 'ip', 'er']],
+  ['testing', ['tg', 'tr', 'tw', 'tt', 'cq', 'cp', 'cf', 'td']],
+  ['release', ['rg', 'rv', 'ra', 'mg', 'rl', 'ps', 'ic', 'JC', 'pm']],
+  ['coordination', ['oa', 'pc', 'fo']],
+  ['admin', ['aa', 'ap']],
+  ['system', ['FF', 'FM']]
+]);
+
+/** Agent roles recommended per signal category */
+const ROLES_BY_CATEGORY: ReadonlyMap<string, readonly string[]> = new Map([
+  ['development', ['Robo-Developer']],
+  ['testing', ['Robo-AQA', 'Robo-Tester']],
+  ['release', ['Robo-QC', 'Robo-DevOps']],
+  ['coordination', ['Robo-System-Analyst', 'Orchestrator']],
+  ['admin', ['Robo-System-Analyst']],
+  ['system', ['Robo-SRE']]
+]);
+
+/** Processing recommendation for signal types that need extra preparation */
+const TYPE_RECOMMENDATIONS: ReadonlyMap<string, string> = new Map([
+  ...['dp', 'tp', 'bf'].map(code => [code, 'Requires code context analysis'] as const),
+  ...['tg', 'tr', 'tw'].map(code => [code, 'Check test infrastructure'] as const),
+  ...['mg', 'rl', 'ps'].map(code => [code, 'Verify deployment readiness'] as const)
+]);
+
+/** Raw signal text features reported by analyzeSignalPattern, compiled once */
+const SIGNAL_TEXT_PATTERNS: ReadonlyArray<{ pattern: RegExp; description: string }> = [
+  { pattern: /\[[A-Z][a-z]\]/, description: 'Standard signal format' },
+  { pattern: /\d{4}-\d{2}-\d{2}/, description: 'Date pattern' }
+];
+
+/** Keyword features share one alternation: group 1 priority, group 2 log level, group 3 status */
+const SIGNAL_KEYWORD_FEATURES = /\b(?:(urgent|critical|high|low|medium)|(error|warning|info|debug)|(failed|success|completed|started))\b/gi;
+
+/** Signal fields used for guideline matching, normalized once per lookup */
+interface SignalMatchProbe {
+  type: string;
+  rawSignal?: string;
+  patternName?: string; // lowercased
+  category: string;
+}
+
+/** Lowercased guideline fields used for substring matching */
+interface GuidelineSearchKeys {
+  name: string;
+  id: string;
+  patternDescriptions: string[]; // aligned with signalPatterns
+}
+
+/** Guideline match tiers for findMatchingGuideline, best first */
+const EXACT_MATCH_TIER = 0;
+const PATTERN_MATCH_TIER = 1;
+const CATEGORY_MATCH_TIER = 2;
+const GENERAL_MATCH_TIER = 3;
+const NO_MATCH_TIER = 4;
+
 interface CacheEntry {
   guideline: string;
   timestamp: number;
 }
 
+/**
+ * Collect the trimmed first capture group of every match, skipping empty ones
+ */
+function collectTrimmedCaptures(content: string, pattern: RegExp): string[] {
+  const values: string[] = [];
+  for (const [, value] of content.matchAll(pattern)) {
+    const trimmed = value ? value.trim() : '';
+    if (trimmed.length > 0) {
+      values.push(trimmed);
+    }
+  }
+  return values;
+}
+
 /**
  * Guideline Adapter - Loads and adapts guidelines for signal processing
  */
 export class GuidelineAdapter {
   private guidelines: Map<string, ExtendedGuidelineConfig> = new Map();
   private guidelineCache: Map<string, CacheEntry> = new Map();
+  private patternAnalysisCache = new LRUCache<string, string>({ max: MAX_PATTERN_ANALYSIS_CACHE_SIZE });
+  private searchKeys = new WeakMap<ExtendedGuidelineConfig, GuidelineSearchKeys>();
   private guidelinesPath: string;
   private lastScanTime: Date = new Date(0);
   private cacheEnabled: boolean;
@@ -147,10 +278,11 @@ export class GuidelineAdapter {
   getGuidelinesByCategory(category: string): ExtendedGuidelineConfig[] {
     // Since GuidelineConfig doesn't have category, return all enabled guidelines
     // Category filtering could be implemented via protocol or naming conventions
-    return this.getEnabledGuidelines().filter(g =>
-      g.name.toLowerCase().includes(category.toLowerCase()) ||
-      g.id.toLowerCase().includes(category.toLowerCase())
-    );
+    const categoryLower = category.toLowerCase();
+    return this.getEnabledGuidelines().filter(g => {
+      const { name, id } = this.getSearchKeys(g);
+      return name.includes(categoryLower) || id.includes(categoryLower);
+    });
   }
 
   /**
@@ -289,35 +421,23 @@ export class GuidelineAdapter {
     }
 
     // Extract signal patterns from content
-    const signalPatternMatches = content.matchAll(/\[([A-Z][a-z])\]\s*-\s*(.+)/g);
-    metadata['signalPatterns'] = Array.from(signalPatternMatches).map((match) => {
-      const [, code, description] = match;
-      return {
+    const signalPatterns: Array<{ code: string; description: string }> = [];
+    for (const [, code, description] of content.matchAll(/\[([A-Z][a-z])\]\s*-\s*(.+)/g)) {
+      signalPatterns.push({
         code: code ? `[${code}]` : '',
         description: description ? description.trim() : ''
-      };
-    });
+      });
+    }
+    metadata['signalPatterns'] = signalPatterns;
 
     // Extract agent roles from content
-    const agentRoleMatches = content.matchAll(/\*\*Agent:\*\*\s*(.+)/g);
-    metadata['agentRoles'] = Array.from(agentRoleMatches).map((match) => {
-      const [, role] = match;
-      return role ? role.trim() : '';
-    }).filter(role => role.length > 0);
+    metadata['agentRoles'] = collectTrimmedCaptures(content, /\*\*Agent:\*\*\s*(.+)/g);
 
     // Extract context requirements
-    const contextMatches = content.matchAll(/\*\*Context:\*\*\s*(.+)/g);
-    metadata['contexts'] = Array.from(contextMatches).map((match) => {
-      const [, context] = match;
-      return context ? context.trim() : '';
-    }).filter(context => context.length > 0);
+    metadata['contexts'] = collectTrimmedCaptures(content, /\*\*Context:\*\*\s*(.+)/g);
 
     // Extract requirements
-    const requirementMatches = content.matchAll(/\*\*Requirement:\*\*\s*(.+)/g);
-    metadata['requirements'] = Array.from(requirementMatches).map((match) => {
-      const [, req] = match;
-      return req ? req.trim() : '';
-    }).filter(req => req.length > 0);
+    metadata['requirements'] = collectTrimmedCaptures(content, /\*\*Requirement:\*\*\s*(.+)/g);
 
     // Extract steps if numbered list is present
     const stepMatches = content.matchAll(/^\d+\.\s+(.+)$/gm);
@@ -380,63 +500,83 @@ export class GuidelineAdapter {
    */
   private findMatchingGuideline(signal: Signal): ExtendedGuidelineConfig | null {
     const enabledGuidelines = this.getEnabledGuidelines();
+    if (enabledGuidelines.length === 0) {
+      return null;
+    }
 
-    // First try exact signal type match
-    let matches = enabledGuidelines.filter(g =>
-      g.signalPatterns?.some(p => p.code === signal.type) || false
-    );
+    // Normalize the signal once, then rank every guideline in a single pass
+    const probe: SignalMatchProbe = {
+      type: signal.type,
+      rawSignal: signal.data?.['rawSignal'] as string | undefined,
+      patternName: (signal.data?.['patternName'] as string | undefined)?.toLowerCase(),
+      category: this.getSignalCategory(signal)
+    };
 
-    if (matches.length === 0) {
-      // Try pattern matching on signal data
-      matches = enabledGuidelines.filter(g =>
-        g.signalPatterns?.some(p =>
-          (signal.data?.['rawSignal'] as string)?.includes(p.code) ||
-          (signal.data?.['patternName'] as string)?.toLowerCase().includes(p.description.toLowerCase())
-        ) || false
-      );
+    // Best tier wins; within a tier the highest priority, first on ties
+    let best: ExtendedGuidelineConfig | null = null;
+    let bestTier = NO_MATCH_TIER;
+    for (const guideline of enabledGuidelines) {
+      const tier = this.getMatchTier(guideline, probe, bestTier);
+      if (tier < bestTier || (best && tier === bestTier && (guideline.priority || 5) > (best.priority || 5))) {
+        best = guideline;
+        bestTier = tier;
+      }
     }
 
-    if (matches.length === 0) {
-      // Try category matching based on naming conventions since GuidelineConfig doesn't have category
-      const signalCategory = this.getSignalCategory(signal);
-      matches = enabledGuidelines.filter(g =>
-        g.name.toLowerCase().includes(signalCategory.toLowerCase()) ||
-        g.id.toLowerCase().includes(signalCategory.toLowerCase())
-      );
-    }
+    return best;
+  }
 
-    if (matches.length === 0) {
-      // Fallback to general guidelines (look for "general" in name/id since no category property)
-      matches = enabledGuidelines.filter(g =>
-        g.name.toLowerCase().includes('general') ||
-        g.id.toLowerCase().includes('general')
-      );
-    }
+  /**
+   * Rank how well a guideline matches a signal, lower is better.
+   * Tiers worse than `limit` cannot change the result and are not checked.
+   */
+  private getMatchTier(guideline: ExtendedGuidelineConfig, probe: SignalMatchProbe, limit: number): number {
+    const patterns = guideline.signalPatterns ?? [];
 
-    // Return highest priority match
-    if (matches.length > 0) {
-      return matches.reduce((best, current) =>
-        (current.priority || 5) > (best.priority || 5) ? current : best
-      );
-    }
+    // Exact signal type match
+    if (patterns.some(p => p.code === probe.type)) return EXACT_MATCH_TIER;
+    if (limit < PATTERN_MATCH_TIER) return NO_MATCH_TIER;
+
+    const { name, id, patternDescriptions } = this.getSearchKeys(guideline);
+
+    // Pattern matching on signal data
+    if (patterns.some((p, index) =>
+      probe.rawSignal?.includes(p.code) ||
+      probe.patternName?.includes(patternDescriptions[index])
+    )) return PATTERN_MATCH_TIER;
+    if (limit < CATEGORY_MATCH_TIER) return NO_MATCH_TIER;
+
+    // Category matching based on naming conventions since GuidelineConfig doesn't have category
+    if (name.includes(probe.category) || id.includes(probe.category)) return CATEGORY_MATCH_TIER;
+    if (limit < GENERAL_MATCH_TIER) return NO_MATCH_TIER;
+
+    // Fallback to general guidelines
+    if (name.includes('general') || id.includes('general')) return GENERAL_MATCH_TIER;
 
-    return null;
+    return NO_MATCH_TIER;
+  }
+
+  /**
+   * Lowercased search fields of a guideline, normalized once per guideline object
+   */
+  private getSearchKeys(guideline: ExtendedGuidelineConfig): GuidelineSearchKeys {
+    let keys = this.searchKeys.get(guideline);
+    if (!keys) {
+      keys = {
+        name: guideline.name.toLowerCase(),
+        id: guideline.id.toLowerCase(),
+        patternDescriptions: (guideline.signalPatterns ?? []).map(p => p.description.toLowerCase())
+      };
+      this.searchKeys.set(guideline, keys);
+    }
+    return keys;
   }
 
   /**
    * Get signal category for fallback matching
    */
   private getSignalCategory(signal: Signal): string {
-    const signalType = signal.type.toLowerCase();
-
-    if (['oa', 'os', 'op', 'or'].includes(signalType)) return 'orchestrator';
-    if (['ap', 'av', 'af', 'as'].includes(signalType)) return 'admin';
-    if (['od', 'oc', 'or', 'oe', 'oa'].includes(signalType)) return 'orchestrator-action';
-    if (['ad', 'ae', 'as', 'aa'].includes(signalType)) return 'admin-action';
-    if (['tt', 'te', 'ti', 'ta', 'td'].includes(signalType)) return 'testing';
-    if (['qb', 'qp', 'pc'].includes(signalType)) return 'quality';
-
-    return 'general';
+    return GUIDELINE_CATEGORY_BY_SIGNAL.get(signal.type.toLowerCase()) ?? 'general';
   }
 
   /**
@@ -444,6 +584,7 @@ export class GuidelineAdapter {
    */
   private async adaptGuidelineForSignal(guideline: ExtendedGuidelineConfig, signal: Signal): Promise<string> {
     let adaptedContent = guideline.content || '';
+    const timestamp = signal.timestamp.toISOString();
 
     // Replace signal placeholders
     adaptedContent = adaptedContent.replace(/\{\{signal\.type\}\}/g, signal.type);
@@ -462,13 +603,12 @@ export class GuidelineAdapter {
     }
 
     // Replace timestamp placeholders
-    adaptedContent = adaptedContent.replace(/\{\{timestamp\}\}/g,
-      signal.timestamp.toISOString());
+    adaptedContent = adaptedContent.replace(/\{\{timestamp\}\}/g, timestamp);
     adaptedContent = adaptedContent.replace(/\{\{timeAgo\}\}/g,
       this.getTimeAgo(signal.timestamp));
 
     // Add enhanced signal-specific context
-    const signalContext = await this.generateEnhancedSignalContext(signal);
+    const signalContext = await this.generateEnhancedSignalContext(signal, timestamp);
     adaptedContent = adaptedContent.replace(/\{\{signal\.context\}\}/g, signalContext);
 
     // Add LLM optimization markers
@@ -480,22 +620,31 @@ export class GuidelineAdapter {
   /**
    * Generate enhanced signal-specific context with Phase 2 features
    */
-  private async generateEnhancedSignalContext(signal: Signal): Promise<string> {
+  private async generateEnhancedSignalContext(signal: Signal, timestamp: string): Promise<string> {
     const context = [];
+    const rawSignal = signal.data?.['rawSignal'] as string | undefined;
+
+    // The analyses are independent of each other, so run them together
+    const [patternAnalysis, categorization, historicalContext, processingRecs] = await Promise.all([
+      rawSignal ? this.analyzeSignalPattern(rawSignal) : Promise.resolve(''),
+      this.categorizeSignal(signal),
+      this.getHistoricalContext(signal),
+      this.getProcessingRecommendations(signal)
+    ]);
+    const agentRoles = this.recommendAgentRoles(categorization.category);
 
     // Basic signal information
     context.push(`**Signal Type:** ${signal.type}`);
     context.push(`**Source:** ${signal.source}`);
     context.push(`**Priority:** ${signal.priority}`);
-    context.push(`**Timestamp:** ${signal.timestamp.toISOString()}`);
+    context.push(`**Timestamp:** ${timestamp}`);
 
     // Enhanced signal data analysis
     if (signal.data) {
-      if (signal.data['rawSignal']) {
-        context.push(`**Raw Signal:** ${signal.data['rawSignal']}`);
+      if (rawSignal) {
+        context.push(`**Raw Signal:** ${rawSignal}`);
 
         // Add signal pattern analysis
-        const patternAnalysis = await this.analyzeSignalPattern(signal.data['rawSignal'] as string);
         context.push(`**Pattern Analysis:** ${patternAnalysis}`);
       }
 
@@ -508,24 +657,20 @@ export class GuidelineAdapter {
       }
 
       // Add signal categorization
-      const categorization = await this.categorizeSignal(signal);
       context.push(`**Category:** ${categorization.category}`);
       context.push(`**Subcategory:** ${categorization.subcategory}`);
       context.push(`**Urgency Level:** ${categorization.urgency}`);
     }
 
     // Add context from similar historical signals
-    const historicalContext = await this.getHistoricalContext(signal);
     if (historicalContext.length > 0) {
       context.push(`**Historical Context:** ${historicalContext.join('; ')}`);
     }
 
     // Add agent role recommendations
-    const agentRoles = await this.recommendAgentRoles(signal);
     context.push(`**Recommended Agent Roles:** ${agentRoles.join(', ')}`);
 
     // Add processing recommendations
-    const processingRecs = await this.getProcessingRecommendations(signal);
     context.push(`**Processing Recommendations:** ${processingRecs.join(', ')}`);
 
     return context.join('\n');
@@ -535,22 +680,44 @@ export class GuidelineAdapter {
    * Analyze signal pattern for enhanced understanding
    */
   private async analyzeSignalPattern(rawSignal: string): Promise<string> {
-    const patterns = [
-      { pattern: /\[([A-Z][a-z])\]/, description: 'Standard signal format' },
-      { pattern: /\d{4}-\d{2}-\d{2}/, description: 'Date pattern' },
-      { pattern: /\b(urgent|critical|high|low|medium)\b/i, description: 'Priority indicator' },
-      { pattern: /\b(error|warning|info|debug)\b/i, description: 'Log level' },
-      { pattern: /\b(failed|success|completed|started)\b/i, description: 'Status indicator' }
-    ];
-
-    const findings = [];
-    for (const { pattern, description } of patterns) {
+    // The analysis depends only on the raw signal text, which repeats across signals
+    const cached = this.patternAnalysisCache.get(rawSignal);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    const findings: string[] = [];
+    for (const { pattern, description } of SIGNAL_TEXT_PATTERNS) {
       if (pattern.test(rawSignal)) {
         findings.push(description);
       }
     }
 
-    return findings.length > 0 ? findings.join(', ') : 'No specific patterns detected';
+    let hasPriority = false;
+    let hasLogLevel = false;
+    let hasStatus = false;
+    for (const match of rawSignal.matchAll(SIGNAL_KEYWORD_FEATURES)) {
+      if (match[1] !== undefined) {
+        hasPriority = true;
+      } else if (match[2] !== undefined) {
+        hasLogLevel = true;
+      } else if (match[3] !== undefined) {
+        hasStatus = true;
+      }
+    }
+    if (hasPriority) {
+      findings.push('Priority indicator');
+    }
+    if (hasLogLevel) {
+      findings.push('Log level');
+    }
+    if (hasStatus) {
+      findings.push('Status indicator');
+    }
+
+    const analysis = findings.length > 0 ? findings.join(', ') : 'No specific patterns detected';
+    this.patternAnalysisCache.set(rawSignal, analysis);
+    return analysis;
   }
 
   /**
@@ -563,30 +730,11 @@ export class GuidelineAdapter {
   }> {
     const signalType = signal.type.toLowerCase();
 
-    // Enhanced categorization logic
-    let category = 'general';
-    let subcategory = 'unknown';
-    let urgency = 'medium';
-
-    // Category mapping
-    const categoryMap = {
-      'development': ['dp', 'tp', 'bf', 'br', 'no', 'bb', 'af', 'rr', 'rc', 'da', 'vp', 'ip', 'er'],
-      'testing': ['tg', 'tr', 'tw', 'tt', 'cq', 'cp', 'cf', 'td'],
-      'release': ['rg', 'rv', 'ra', 'mg', 'rl', 'ps', 'ic', 'JC', 'pm'],
-      'coordination': ['oa', 'pc', 'fo'],
-      'admin': ['aa', 'ap'],
-      'system': ['FF', 'FM']
-    };
-
     // Find category
-    for (const [cat, types] of Object.entries(categoryMap)) {
-      if (types.includes(signalType)) {
-        category = cat;
-        break;
-      }
-    }
+    const category = CONTEXT_CATEGORY_BY_SIGNAL.get(signalType) ?? 'general';
 
     // Determine subcategory
+    let subcategory: string;
     if (signal.data?.['patternName']) {
       subcategory = signal.data['patternName'] as string;
     } else {
@@ -594,10 +742,7 @@ export class GuidelineAdapter {
     }
 
     // Determine urgency based on priority
-    if (signal.priority >= 9) urgency = 'critical';
-    else if (signal.priority >= 7) urgency = 'high';
-    else if (signal.priority >= 5) urgency = 'medium';
-    else urgency = 'low';
+    const urgency = URGENCY_THRESHOLDS.find(([minPriority]) => signal.priority >= minPriority)?.[1] ?? 'low';
 
     return { category, subcategory, urgency };
   }
@@ -628,32 +773,11 @@ export class GuidelineAdapter {
   }
 
   /**
-   * Recommend agent roles for signal processing
+   * Recommend agent roles for an already categorized signal
    */
-  private async recommendAgentRoles(signal: Signal): Promise<string[]> {
-    const roles = [];
-
-    // Role recommendation logic based on signal type
-    const roleMap = {
-      'development': ['Robo-Developer'],
-      'testing': ['Robo-AQA', 'Robo-Tester'],
-      'release': ['Robo-QC', 'Robo-DevOps'],
-      'coordination': ['Robo-System-Analyst', 'Orchestrator'],
-      'admin': ['Robo-System-Analyst'],
-      'system': ['Robo-SRE']
-    };
-
-    const categorization = await this.categorizeSignal(signal);
-    if (roleMap[categorization.category as keyof typeof roleMap]) {
-      roles.push(...roleMap[categorization.category as keyof typeof roleMap]);
-    }
-
-    // Add fallback role
-    if (roles.length === 0) {
-      roles.push('Robo-Developer');
-    }
-
-    return roles;
+  private recommendAgentRoles(category: string): string[] {
+    // Fall back to the developer role for uncategorized signals
+    return [...(ROLES_BY_CATEGORY.get(category) ?? ['Robo-Developer'])];
   }
 
   /**
@@ -675,15 +799,9 @@ export class GuidelineAdapter {
     }
 
     // Type-based recommendations
-    const signalType = signal.type.toLowerCase();
-    if (['dp', 'tp', 'bf'].includes(signalType)) {
-      recommendations.push('Requires code context analysis');
-    }
-    if (['tg', 'tr', 'tw'].includes(signalType)) {
-      recommendations.push('Check test infrastructure');
-    }
-    if (['mg', 'rl', 'ps'].includes(signalType)) {
-      recommendations.push('Verify deployment readiness');
+    const typeRecommendation = TYPE_RECOMMENDATIONS.get(signal.type.toLowerCase());
+    if (typeRecommendation) {
+      recommendations.push(typeRecommendation);
     }
 
     return recommendations;
@@ -693,50 +811,21 @@ export class GuidelineAdapter {
    * Add LLM optimization markers for 40K token constraint
    */
   private addLLMOptimizationMarkers(content: string, signal: Signal): string {
-    // Add section markers for better LLM processing
-    const sections = [
-      '## SIGNAL ANALYSIS GUIDELINE',
-      '### Context Information',
-      '### Processing Instructions',
-      '### Expected Outputs',
-      '### Quality Criteria'
-    ];
-
     let optimizedContent = content;
 
-    // Add markers if not already present
-    sections.forEach(section => {
-      if (!optimizedContent.includes(section)) {
-        // Insert section at appropriate locations
-        if (section === '## SIGNAL ANALYSIS GUIDELINE' && !optimizedContent.startsWith('##')) {
-          optimizedContent = section + '\n\n' + optimizedContent;
-        }
-      }
-    });
+    // Add the guideline header unless the content already opens with a heading
+    if (!optimizedContent.startsWith('##') && !optimizedContent.includes(GUIDELINE_HEADER)) {
+      optimizedContent = GUIDELINE_HEADER + '\n\n' + optimizedContent;
+    }
 
-    // Add token optimization hints
-    const tokenHints = [
-      '<!-- TOKEN_HINT: Focus on key decision points -->',
-      '<!-- TOKEN_HINT: Prioritize actionable recommendations -->',
-      '<!-- TOKEN_HINT: Limit historical examples to 2-3 most relevant -->'
-    ];
-
-    // Add hints at strategic points
-    tokenHints.forEach(hint => {
-      if (!optimizedContent.includes(hint)) {
-        optimizedContent = optimizedContent.replace(/\n\n### /g, `\n${hint}\n\n### `);
-      }
-    });
+    // Add missing token optimization hints before every subsection in one replace
+    const missingHints = TOKEN_HINTS.filter(hint => !optimizedContent.includes(hint));
+    if (missingHints.length > 0) {
+      optimizedContent = optimizedContent.replace(SUBSECTION_BREAK, `\n${missingHints.join('\n')}\n\n### `);
+    }
 
     // Add signal-specific optimization markers
-    const priorityMarkers = {
-      9: '<!-- PRIORITY: CRITICAL - Immediate processing required -->',
-      7: '<!-- PRIORITY: HIGH - Process with urgency -->',
-      5: '<!-- PRIORITY: MEDIUM - Standard processing -->',
-      3: '<!-- PRIORITY: LOW - Can be deferred -->'
-    };
-
-    const marker = priorityMarkers[signal.priority as keyof typeof priorityMarkers] || '';
+    const marker = PRIORITY_MARKERS.get(signal.priority) ?? '';
     if (marker && !optimizedContent.includes(marker)) {
       optimizedContent = marker + '\n\n' + optimizedContent;
     }
@@ -780,6 +869,7 @@ export class GuidelineAdapter {
    */
   clearCache(): void {
     this.guidelineCache.clear();
+    this.patternAnalysisCache.clear();
     logger.info('GuidelineAdapter', 'Guideline cache cleared');
   }
 
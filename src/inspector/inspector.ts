@@ -35,6 +35,22 @@ import { storageManager } from '../storage';
 
 const logger = createLayerLogger('inspector');
 
+/** Words separated by single spaces, same as text.split(' ').length without building the array */
+const countWords = (text: string): number => {
+  let count = 1;
+  for (let index = text.indexOf(' '); index !== -1; index = text.indexOf(' ', index + 1)) {
+    count++;
+  }
+  return count;
+};
+
+/**
+ * Substitute a prompt placeholder with compact JSON; the value is only
+ * serialized when the template actually contains the placeholder
+ */
+const fillPromptPlaceholder = (prompt: string, placeholder: string, value: unknown): string =>
+  prompt.includes(placeholder) ? prompt.replace(placeholder, JSON.stringify(value)) : prompt;
+
 // Interface for model response usage
 interface ModelUsage {
   promptTokens?: number;
@@ -428,20 +444,41 @@ export class Inspector extends EventEmitter {
    * Prepare processing context
    */
   private async prepareProcessingContext(signal: Signal): Promise<ProcessingContext> {
-    const context: ProcessingContext = {
+    // The context sources are independent, so gather them concurrently
+    const [
+      relatedSignals,
+      activePRPs,
+      recentActivity,
+      tokenStatus,
+      agentStatus,
+      sharedNotes,
+      environment,
+      guidelineContext,
+      historicalData
+    ] = await Promise.all([
+      this.getRelatedSignals(signal),
+      this.getActivePRPs(),
+      this.getRecentActivity(),
+      this.getTokenStatus(),
+      this.getAgentStatus(),
+      this.getSharedNotes(),
+      this.getEnvironmentInfo(),
+      this.getGuidelineContext(),
+      this.getHistoricalData(signal)
+    ]);
+
+    return {
       signalId: signal.id,
-      relatedSignals: await this.getRelatedSignals(signal),
-      activePRPs: await this.getActivePRPs(),
-      recentActivity: await this.getRecentActivity(),
-      tokenStatus: await this.getTokenStatus(),
-      agentStatus: await this.getAgentStatus(),
-      sharedNotes: await this.getSharedNotes(),
-      environment: await this.getEnvironmentInfo(),
-      guidelineContext: await this.getGuidelineContext(),
-      historicalData: await this.getHistoricalData(signal)
+      relatedSignals,
+      activePRPs,
+      recentActivity,
+      tokenStatus,
+      agentStatus,
+      sharedNotes,
+      environment,
+      guidelineContext,
+      historicalData
     };
-
-    return context;
   }
 
   /**
@@ -489,6 +526,8 @@ export class Inspector extends EventEmitter {
     classification: SignalClassification,
     context: ProcessingContext
   ): Promise<PreparedContext> {
+    const relevantIds = new Set([classification.signal.id, ...context.activePRPs]);
+
     return {
       summary: this.generateContextSummary(classification, context),
       activePRPs: context.activePRPs,
@@ -514,9 +553,7 @@ export class Inspector extends EventEmitter {
         }
       })),
       sharedNotes: context.sharedNotes.filter(note =>
-        Array.isArray(note.relevantTo) && note.relevantTo.some(id =>
-          [classification.signal.id, ...context.activePRPs].includes(id)
-        )
+        Array.isArray(note.relevantTo) && note.relevantTo.some(id => relevantIds.has(id))
       )
     };
   }
@@ -739,18 +776,21 @@ export class Inspector extends EventEmitter {
 
   private async getSharedNotes(): Promise<SharedNoteInfo[]> {
     const notes = storageManager.getAllNotes();
-    return notes.map(note => ({
-      id: note.id,
-      name: note.name,
-      pattern: note.pattern,
-      content: note.content,
-      lastModified: note.lastModified,
-      tags: note.tags,
-      relevantTo: Array.isArray(note.relevantTo) ? note.relevantTo : [],
-      priority: 1,
-      wordCount: note.content.split(' ').length,
-      readingTime: Math.ceil(note.content.split(' ').length / 200)
-    }));
+    return notes.map(note => {
+      const wordCount = countWords(note.content);
+      return {
+        id: note.id,
+        name: note.name,
+        pattern: note.pattern,
+        content: note.content,
+        lastModified: note.lastModified,
+        tags: note.tags,
+        relevantTo: Array.isArray(note.relevantTo) ? note.relevantTo : [],
+        priority: 1,
+        wordCount,
+        readingTime: Math.ceil(wordCount / 200)
+      };
+    });
   }
 
   private async getEnvironmentInfo(): Promise<import('./types').EnvironmentInfo> {
@@ -832,8 +872,8 @@ Focus on accuracy and provide clear reasoning for your classification.`;
     let prompt = this.config.prompts.classification;
 
     // Replace placeholders
-    prompt = prompt.replace('{{signal}}', JSON.stringify(signal, null, 2));
-    prompt = prompt.replace('{{context}}', JSON.stringify(context, null, 2));
+    prompt = fillPromptPlaceholder(prompt, '{{signal}}', signal);
+    prompt = fillPromptPlaceholder(prompt, '{{context}}', context);
 
     return prompt;
   }
@@ -841,8 +881,8 @@ Focus on accuracy and provide clear reasoning for your classification.`;
   private buildRecommendationPrompt(classification: SignalClassification, context: ProcessingContext): string {
     let prompt = this.config.prompts.recommendationGeneration;
 
-    prompt = prompt.replace('{{classification}}', JSON.stringify(classification, null, 2));
-    prompt = prompt.replace('{{context}}', JSON.stringify(context, null, 2));
+    prompt = fillPromptPlaceholder(prompt, '{{classification}}', classification);
+    prompt = fillPromptPlaceholder(prompt, '{{context}}', context);
 
     return prompt;
   }
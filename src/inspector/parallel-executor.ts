@@ -378,17 +378,18 @@ export class ParallelExecutor extends EventEmitter {
    * Get executor status
    */
   getStatus(): WorkerPoolStatus {
-    const activeWorkers = Array.from(this.workers.values()).filter(w => w.status === 'active').length;
-    const busyWorkers = Array.from(this.workers.values()).filter(w => w.status === 'busy').length;
-    const idleWorkers = Array.from(this.workers.values()).filter(w => w.status === 'idle').length;
-    const failedWorkers = Array.from(this.workers.values()).filter(w => w.status === 'failed').length;
+    // Tally worker statuses in a single pass
+    const statusCounts = new Map<string, number>();
+    for (const worker of this.workers.values()) {
+      statusCounts.set(worker.status, (statusCounts.get(worker.status) ?? 0) + 1);
+    }
 
     return {
       totalWorkers: this.workers.size,
-      activeWorkers,
-      idleWorkers,
-      busyWorkers,
-      failedWorkers,
+      activeWorkers: statusCounts.get('active') ?? 0,
+      idleWorkers: statusCounts.get('idle') ?? 0,
+      busyWorkers: statusCounts.get('busy') ?? 0,
+      failedWorkers: statusCounts.get('failed') ?? 0,
       queueSize: this.taskQueue.length,
       processingTasks: this.processingTasks.size,
       completedTasks: this.completedTasks.size,
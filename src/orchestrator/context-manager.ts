@@ -217,7 +217,7 @@ export class ContextManager {
     // Persist PRP context
     await this.persistPRPContext(prp.name, sections);
 
-    logger.debug('updatePRPContext', `PRP context updated: ${prp.name}`);
+    logger.debug('updatePRPContext', 'PRP context updated', { prp: prp.name });
   }
 
   /**
@@ -227,7 +227,7 @@ export class ContextManager {
     const sections = await this.createAgentSections(agentId, context as { status?: string; capabilities?: unknown });
     this.agentContexts.set(agentId, sections);
 
-    logger.debug('updateAgentContext', `Agent context updated: ${agentId}`);
+    logger.debug('updateAgentContext', 'Agent context updated', { agentId });
   }
 
   /**
@@ -639,32 +639,31 @@ Always think step-by-step and explain your reasoning clearly.`),
   }
 
   private formatWarzoneContext(): string {
-    const warzone = this.sharedContext.warzone;
+    const { blockers, completed, next } = this.sharedContext.warzone;
+    const lines = ['Warzone Context:'];
 
-    let output = 'Warzone Context:\n';
-
-    if (warzone.blockers.length > 0) {
-      output += `Blockers (${warzone.blockers.length}):\n`;
-      warzone.blockers.forEach((blocker) => {
-        output += `- ${blocker.description} (Priority: ${blocker.priority})\n`;
-      });
+    if (blockers.length > 0) {
+      lines.push(`Blockers (${blockers.length}):`);
+      for (const { description, priority } of blockers) {
+        lines.push(`- ${description} (Priority: ${priority})`);
+      }
     }
 
-    if (warzone.completed.length > 0) {
-      output += `Completed (${warzone.completed.length}):\n`;
-      warzone.completed.forEach((completed) => {
-        output += `- ${completed.description} (${completed.prp})\n`;
-      });
+    if (completed.length > 0) {
+      lines.push(`Completed (${completed.length}):`);
+      for (const { description, prp } of completed) {
+        lines.push(`- ${description} (${prp})`);
+      }
     }
 
-    if (warzone.next.length > 0) {
-      output += `Next Actions (${warzone.next.length}):\n`;
-      warzone.next.forEach((next) => {
-        output += `- ${next.description} (Priority: ${next.priority})\n`;
-      });
+    if (next.length > 0) {
+      lines.push(`Next Actions (${next.length}):`);
+      for (const { description, priority } of next) {
+        lines.push(`- ${description} (Priority: ${priority})`);
+      }
     }
 
-    return output;
+    return `${lines.join('\n')}\n`;
   }
 
   private formatAgentStatuses(activeAgents: unknown[]): string {
@@ -55,6 +55,78 @@ const createDefaultInspectorPayload = (): InspectorPayload => ({
   priority: 0
 });
 
+/** Signal types assessed as high urgency */
+const HIGH_URGENCY_SIGNALS: ReadonlySet<string> = new Set(['At', 'Bb', 'Ur', 'AE', 'AA']);
+
+/** Signal types assessed as high complexity */
+const COMPLEX_SIGNALS: ReadonlySet<string> = new Set(['pr', 'af', 'od', 'oc']);
+
+/** Complexity added when a decision field holds more than `threshold` entries */
+const DECISION_COMPLEXITY_WEIGHTS: ReadonlyArray<{
+  field: 'actions' | 'blockers' | 'next';
+  threshold: number;
+  weight: number;
+}> = [
+  { field: 'actions', threshold: 2, weight: 0.2 },
+  { field: 'blockers', threshold: 0, weight: 0.3 },
+  { field: 'next', threshold: 3, weight: 0.2 }
+];
+
+/** Options considered for signal types without a dedicated option list */
+const BASE_OPTIONS: readonly string[] = [
+  'Process signal with available tools',
+  'Delegate to specialized agent',
+  'Request additional information',
+  'Escalate to human intervention'
+];
+
+/** Options considered per signal type */
+const SIGNAL_OPTIONS: ReadonlyMap<string, readonly string[]> = new Map([
+  ['pr', [
+    'Review pull request changes',
+    'Run automated checks',
+    'Assign reviewers',
+    'Request additional information'
+  ]],
+  ['tt', [
+    'Run test suite',
+    'Review test coverage',
+    'Create new tests',
+    'Debug failing tests'
+  ]],
+  ['Qb', [
+    'Analyze bug report',
+    'Reproduce issue',
+    'Fix bug',
+    'Create regression tests'
+  ]]
+]);
+
+/** Follow-up step planned per signal type */
+const SIGNAL_NEXT_STEPS: ReadonlyMap<string, string> = new Map([
+  ['op', 'Continue monitoring progress'],
+  ['tt', 'Review test results and update status']
+]);
+
+/** Agent preferred per signal type */
+const SIGNAL_AGENTS: ReadonlyMap<string, string> = new Map([
+  ['pr', 'robo-developer'],
+  ['tt', 'robo-aqa'],
+  ['Qb', 'robo-aqa'],
+  ['af', 'robo-system-analyst'],
+  ['op', 'robo-developer']
+]);
+
+/** Priority bands as [exclusive lower bound, label], highest first */
+type PriorityBands = ReadonlyArray<readonly [number, string]>;
+
+const ATTENTION_BANDS: PriorityBands = [[8, 'IMMEDIATE'], [5, 'HIGH']];
+const RISK_BANDS: PriorityBands = [[9, 'HIGH'], [7, 'MEDIUM']];
+
+/** Label of the first band a priority exceeds, or the fallback */
+const classifyPriority = (priority: number, bands: PriorityBands, fallback: string): string =>
+  bands.find(([bound]) => priority > bound)?.[1] ?? fallback;
+
 interface ChainOfThoughtContext {
   signalId: string;
   timestamp: Date;
@@ -98,6 +170,7 @@ export class CoTProcessor {
     });
 
     const startTime = Date.now();
+    const timestamp = new Date(startTime);
     const cotId = HashUtils.generateId();
 
     try {
@@ -113,15 +186,15 @@ export class CoTProcessor {
       };
 
       // Generate reasoning steps
-      const steps = await this.generateReasoningSteps(signal, processingContext, guideline);
+      const steps = this.generateReasoningSteps(signal, processingContext, guideline, timestamp);
 
       // Generate final decision
-      const decision = await this.generateDecision(signal, steps, processingContext);
+      const decision = this.generateDecision(signal, steps, processingContext);
 
       // Create Chain of Thought result
       const cotContext: ChainOfThoughtContext = {
         signalId: signal.id,
-        timestamp: new Date(),
+        timestamp,
         reasoning: this.formatReasoning(steps)
       };
 
@@ -147,8 +220,8 @@ export class CoTProcessor {
       return cot;
 
     } catch (error) {
-      logger.error('orchestrator', 'Failed to generate Chain of Thought',
-        error instanceof Error ? error.message : String(error));
+      logger.error('orchestrator', 'cot-processor', 'Failed to generate Chain of Thought',
+        error instanceof Error ? error : new Error(String(error)), { signalId: signal.id });
       throw error;
     }
   }
@@ -202,27 +275,28 @@ export class CoTProcessor {
   /**
    * Generate reasoning steps
    */
-  private async generateReasoningSteps(
+  private generateReasoningSteps(
     signal: Signal,
     context: CoTContext,
-    _guideline: string
-  ): Promise<CoTStep[]> {
+    _guideline: string,
+    timestamp: Date
+  ): CoTStep[] {
     const steps: CoTStep[] = [];
 
     // Step 1: Analyze the signal
-    steps.push(await this.createAnalysisStep(signal, context));
+    steps.push(this.createAnalysisStep(signal, context, timestamp));
 
     // Step 2: Consider context and constraints
-    steps.push(await this.createConsiderationStep(signal, context));
+    steps.push(this.createConsiderationStep(signal, context, timestamp));
 
     // Step 3: Evaluate options and alternatives
-    steps.push(await this.createEvaluationStep(signal, context));
+    steps.push(this.createEvaluationStep(signal, context, timestamp));
 
     // Step 4: Make decision
-    steps.push(await this.createDecisionStep(signal, context));
+    steps.push(this.createDecisionStep(signal, context, timestamp));
 
     // Step 5: Verify decision
-    steps.push(await this.createVerificationStep(signal, context));
+    steps.push(this.createVerificationStep(signal, context, timestamp));
 
     return steps;
   }
@@ -230,7 +304,7 @@ export class CoTProcessor {
   /**
    * Create analysis step
    */
-  private async createAnalysisStep(signal: Signal, _context: CoTContext): Promise<CoTStep> {
+  private createAnalysisStep(signal: Signal, _context: CoTContext, timestamp: Date): CoTStep {
     const analysis = `Signal Analysis:
 - Type: ${signal.type}
 - Priority: ${signal.priority}
@@ -246,14 +320,14 @@ export class CoTProcessor {
       content: analysis,
       reasoning: 'Understanding what the signal means and its immediate implications',
       confidence: 0.9,
-      timestamp: new Date()
+      timestamp
     };
   }
 
   /**
    * Create consideration step
    */
-  private async createConsiderationStep(_signal: Signal, context: CoTContext): Promise<CoTStep> {
+  private createConsiderationStep(_signal: Signal, context: CoTContext, timestamp: Date): CoTStep {
     const systemState = context.systemState as { status?: string } | undefined;
     const considerations = [
       `System State: ${systemState?.status || 'active'}`,
@@ -268,14 +342,14 @@ export class CoTProcessor {
       content: considerations.join('\n'),
       reasoning: 'Evaluating how the signal fits within current system state and constraints',
       confidence: 0.8,
-      timestamp: new Date()
+      timestamp
     };
   }
 
   /**
    * Create evaluation step
    */
-  private async createEvaluationStep(signal: Signal, context: CoTContext): Promise<CoTStep> {
+  private createEvaluationStep(signal: Signal, context: CoTContext, timestamp: Date): CoTStep {
     const options = this.generateOptions(signal, context);
 
     return {
@@ -285,14 +359,14 @@ export class CoTProcessor {
       reasoning: 'Considering different approaches to handle this signal',
       alternatives: options,
       confidence: 0.7,
-      timestamp: new Date()
+      timestamp
     };
   }
 
   /**
    * Create decision step
    */
-  private async createDecisionStep(signal: Signal, context: CoTContext): Promise<CoTStep> {
+  private createDecisionStep(signal: Signal, context: CoTContext, timestamp: Date): CoTStep {
     const decision = this.makeDecision(signal, context);
 
     return {
@@ -302,14 +376,14 @@ export class CoTProcessor {
       reasoning: 'Based on analysis and evaluation, determining the best course of action',
       decision: decision,
       confidence: 0.8,
-      timestamp: new Date()
+      timestamp
     };
   }
 
   /**
    * Create verification step
    */
-  private async createVerificationStep(signal: Signal, context: CoTContext): Promise<CoTStep> {
+  private createVerificationStep(signal: Signal, context: CoTContext, timestamp: Date): CoTStep {
     const verification = `Decision Verification:
 - Risk Assessment: ${this.assessRisk(signal, context)}
 - Resource Requirements: ${this.assessResourceRequirements(signal, context)}
@@ -322,18 +396,18 @@ export class CoTProcessor {
       content: verification,
       reasoning: 'Double-checking the decision for potential problems and ensuring it aligns with goals',
       confidence: 0.85,
-      timestamp: new Date()
+      timestamp
     };
   }
 
   /**
    * Generate final decision
    */
-  private async generateDecision(
+  private generateDecision(
     signal: Signal,
     steps: CoTStep[],
     context: CoTContext
-  ): Promise<ChainOfThought['decision']> {
+  ): ChainOfThought['decision'] {
     const decisionStep = steps.find(step => step.type === 'decide');
 
     const action = decisionStep?.decision || 'No action determined';
@@ -351,6 +425,9 @@ export class CoTProcessor {
     // Plan next steps
     const next = this.planNextSteps(signal, context);
 
+    // Confidence depends only on the steps, so it is scored once for all actions
+    const confidence = this.calculateConfidence(steps, { blockers: [], completed: [], next: [], actions: [] });
+
     return {
       blockers,
       completed,
@@ -359,7 +436,7 @@ export class CoTProcessor {
         type: 'orchestration',
         task: action,
         signalType: signal.type,
-        data: { reasoning, confidence: this.calculateConfidence(steps, { blockers: [], completed: [], next: [], actions: [] }) }
+        data: { reasoning, confidence }
       }))
     };
   }
@@ -414,55 +491,20 @@ export class CoTProcessor {
 
   // Helper methods for assessment and analysis
   private assessUrgency(signal: Signal): string {
-    const highPrioritySignals = ['At', 'Bb', 'Ur', 'AE', 'AA'];
-    return highPrioritySignals.includes(signal.type) ? 'HIGH' : 'MEDIUM';
+    return HIGH_URGENCY_SIGNALS.has(signal.type) ? 'HIGH' : 'MEDIUM';
   }
 
   private assessComplexity(signal: Signal): string {
-    const complexSignals = ['pr', 'af', 'od', 'oc'];
-    return complexSignals.includes(signal.type) ? 'HIGH' : 'LOW';
+    return COMPLEX_SIGNALS.has(signal.type) ? 'HIGH' : 'LOW';
   }
 
   private assessRequiredAttention(signal: Signal): string {
-    if (signal.priority > 8) return 'IMMEDIATE';
-    if (signal.priority > 5) return 'HIGH';
-    return 'NORMAL';
+    return classifyPriority(signal.priority, ATTENTION_BANDS, 'NORMAL');
   }
 
   private generateOptions(signal: Signal, _context: CoTContext): string[] {
-    const baseOptions = [
-      'Process signal with available tools',
-      'Delegate to specialized agent',
-      'Request additional information',
-      'Escalate to human intervention'
-    ];
-
     // Customize options based on signal type
-    switch (signal.type) {
-      case 'pr':
-        return [
-          'Review pull request changes',
-          'Run automated checks',
-          'Assign reviewers',
-          'Request additional information'
-        ];
-      case 'tt':
-        return [
-          'Run test suite',
-          'Review test coverage',
-          'Create new tests',
-          'Debug failing tests'
-        ];
-      case 'Qb':
-        return [
-          'Analyze bug report',
-          'Reproduce issue',
-          'Fix bug',
-          'Create regression tests'
-        ];
-      default:
-        return baseOptions;
-    }
+    return [...(SIGNAL_OPTIONS.get(signal.type) ?? BASE_OPTIONS)];
   }
 
   private makeDecision(signal: Signal, context: CoTContext): string {
@@ -531,34 +573,13 @@ export class CoTProcessor {
   }
 
   private planNextSteps(signal: Signal, _context: CoTContext): string[] {
-    const next = [];
-
     // Plan follow-up actions based on signal type
-    switch (signal.type) {
-      case 'op':
-        next.push('Continue monitoring progress');
-        break;
-      case 'tt':
-        next.push('Review test results and update status');
-        break;
-      default:
-        next.push('Monitor signal resolution');
-    }
-
-    return next;
+    return [SIGNAL_NEXT_STEPS.get(signal.type) ?? 'Monitor signal resolution'];
   }
 
   private selectBestAgent(signal: Signal, _context: CoTContext): string {
     // Simple agent selection logic
-    const signalAgentMap: Record<string, string> = {
-      'pr': 'robo-developer',
-      'tt': 'robo-aqa',
-      'Qb': 'robo-aqa',
-      'af': 'robo-system-analyst',
-      'op': 'robo-developer'
-    };
-
-    return signalAgentMap[signal.type] || 'robo-developer';
+    return SIGNAL_AGENTS.get(signal.type) || 'robo-developer';
   }
 
   
@@ -566,18 +587,15 @@ export class CoTProcessor {
     if (!decision) return 0;
 
     let complexity = 0;
-
-    if (decision.actions && decision.actions.length > 2) complexity += 0.2;
-    if (decision.blockers && decision.blockers.length > 0) complexity += 0.3;
-    if (decision.next && decision.next.length > 3) complexity += 0.2;
+    for (const { field, threshold, weight } of DECISION_COMPLEXITY_WEIGHTS) {
+      if ((decision[field]?.length ?? 0) > threshold) complexity += weight;
+    }
 
     return Math.min(1.0, complexity);
   }
 
   private assessRisk(signal: Signal, _context: CoTContext): string {
-    if (signal.priority > 9) return 'HIGH';
-    if (signal.priority > 7) return 'MEDIUM';
-    return 'LOW';
+    return classifyPriority(signal.priority, RISK_BANDS, 'LOW');
   }
 
   private assessResourceRequirements(signal: Signal, _context: CoTContext): string {
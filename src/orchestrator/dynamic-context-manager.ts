@@ -376,16 +376,27 @@ export class DynamicContextManager extends EventEmitter {
   getAgentStatistics() : unknown {
     const agents = Array.from(this.agentCapabilities.values());
 
+    // Tally status counts and token totals in a single pass
+    const statusCounts = { active: 0, idle: 0, token_limited: 0, error: 0 };
+    let totalTokensUsed = 0;
+    let totalTokenLimit = 0;
+    let totalPercentage = 0;
+    for (const agent of agents) {
+      statusCounts[agent.status]++;
+      totalTokensUsed += agent.tokenLimits.current;
+      totalTokenLimit += agent.tokenLimits.daily;
+      totalPercentage += agent.tokenLimits.percentage;
+    }
+
     return {
       totalAgents: agents.length,
-      activeAgents: agents.filter(a => a.status === 'active').length,
-      idleAgents: agents.filter(a => a.status === 'idle').length,
-      tokenLimitedAgents: agents.filter(a => a.status === 'token_limited').length,
-      errorAgents: agents.filter(a => a.status === 'error').length,
-      totalTokensUsed: agents.reduce((sum, a) => sum + a.tokenLimits.current, 0),
-      totalTokenLimit: agents.reduce((sum, a) => sum + a.tokenLimits.daily, 0),
-      averageTokenUsage: agents.length > 0 ?
-        agents.reduce((sum, a) => sum + a.tokenLimits.percentage, 0) / agents.length : 0,
+      activeAgents: statusCounts.active,
+      idleAgents: statusCounts.idle,
+      tokenLimitedAgents: statusCounts.token_limited,
+      errorAgents: statusCounts.error,
+      totalTokensUsed,
+      totalTokenLimit,
+      averageTokenUsage: agents.length > 0 ? totalPercentage / agents.length : 0,
       agentBreakdown: agents.map(agent => ({
         id: agent.id,
         type: agent.type,
@@ -12,13 +12,72 @@ import { AgentManager } from './agent-manager';
 
 const logger = createLayerLogger('orchestrator');
 
+/** Single-pass matcher for blocker keywords, see BLOCKER_KEYWORD_BITS */
+const BLOCKER_KEYWORD_PATTERN = /technical|implementation|test|quality|analysis|research/g;
+
+const DEVELOPER_BIT = 1;
+const AQA_BIT = 2;
+const SYSTEM_ANALYST_BIT = 4;
+
+/** Agent bit for the agent type able to resolve a blocker mentioning each keyword */
+const BLOCKER_KEYWORD_BITS: Record<string, number> = {
+  technical: DEVELOPER_BIT,
+  implementation: DEVELOPER_BIT,
+  test: AQA_BIT,
+  quality: AQA_BIT,
+  analysis: SYSTEM_ANALYST_BIT,
+  research: SYSTEM_ANALYST_BIT
+};
+
+/** Required agent list for every combination of agent bits */
+const BLOCKER_AGENTS_BY_MASK: ReadonlyArray<readonly string[]> = Array.from({ length: 8 }, (_, mask) =>
+  Object.freeze([
+    ...(mask & DEVELOPER_BIT ? ['robo-developer'] : []),
+    ...(mask & AQA_BIT ? ['robo-aqa'] : []),
+    ...(mask & SYSTEM_ANALYST_BIT ? ['robo-system-analyst'] : [])
+  ])
+);
+
+/** Agent requirements per PRP status, shared read-only between tasks */
+const PRP_STATUS_AGENT_REQUIREMENTS: Partial<Record<PRPStatus['status'], readonly string[]>> = Object.freeze({
+  planning: Object.freeze(['robo-system-analyst']),
+  implementation: Object.freeze(['robo-developer']),
+  testing: Object.freeze(['robo-aqa']),
+  review: Object.freeze(['robo-system-analyst', 'robo-aqa'])
+});
+
+const DEFAULT_AGENT_REQUIREMENTS: readonly string[] = Object.freeze(['robo-developer']);
+
+type TaskTemplate = Readonly<Pick<TaskPriority, 'urgency' | 'estimatedTime' | 'dependencies'>>;
+
+const NO_DEPENDENCIES: readonly string[] = Object.freeze([]);
+
+/** Static fields of the task kinds built by extractPriorities */
+const BLOCKED_TASK_TEMPLATE: TaskTemplate = Object.freeze({
+  urgency: 'critical',
+  estimatedTime: 30, // 30 minutes for unblocking
+  dependencies: NO_DEPENDENCIES
+});
+
+const STALLED_TASK_TEMPLATE: TaskTemplate = Object.freeze({
+  urgency: 'high',
+  estimatedTime: 60,
+  dependencies: NO_DEPENDENCIES
+});
+
+const IMPLEMENTATION_TASK_TEMPLATE: TaskTemplate = Object.freeze({
+  urgency: 'medium',
+  estimatedTime: 120,
+  dependencies: NO_DEPENDENCIES
+});
+
 export interface TaskPriority {
   prpId: string;
   priority: number;
   urgency: 'critical' | 'high' | 'medium' | 'low';
   estimatedTime: number;
-  dependencies: string[];
-  agentRequirements: string[];
+  dependencies: readonly string[];
+  agentRequirements: readonly string[];
 }
 
 export interface CycleContext {
@@ -62,6 +121,13 @@ export interface TaskExecution {
   result?: unknown;
 }
 
+/**
+ * Signal payload fields read by the signal handlers, extracted once per signal
+ */
+interface SignalPayload {
+  message: string;
+}
+
 /**
  * Ephemeral Orchestrator for signal-driven agent coordination
  */
@@ -71,6 +137,13 @@ export class EphemeralOrchestrator extends EventEmitter {
   private currentCycle: CycleContext | null = null;
   private _executionPlans: Map<string, ExecutionPlan> = new Map();
   private isRunning = false;
+  private backgroundTasks: Set<Promise<void>> = new Set();
+  private readonly signalHandlers: Map<string, (signal: EphemeralSignal, payload: SignalPayload) => void> = new Map([
+    ['user', (_signal, payload) => this.handleUserSignal(payload)],
+    ['emergency', (signal, payload) => this.handleEmergencySignal(signal, payload)],
+    ['admin', (signal, payload) => this.handleAdminSignal(signal, payload)],
+    ['development', signal => this.handleDevelopmentSignal(signal)]
+  ]);
 
   constructor(toolRegistry: ToolRegistry, agentManager: AgentManager) {
     super();
@@ -100,7 +173,7 @@ export class EphemeralOrchestrator extends EventEmitter {
     }
 
     this.isRunning = true;
-    const cycleId = HashUtils.generateId();
+    const cycleId = HashUtils.generateSequentialId('cycle');
 
     this.currentCycle = {
       cycleId,
@@ -113,7 +186,7 @@ export class EphemeralOrchestrator extends EventEmitter {
 
     ephemeralSignalSystem.startCycle(cycleId);
 
-    logger.info('EphemeralOrchestrator', `Started orchestration cycle ${cycleId}`);
+    logger.info('EphemeralOrchestrator', 'Started orchestration cycle', { cycleId });
 
     // Generate initial [HF] signal and start processing
     await this.processEphemeralSignal();
@@ -148,48 +221,40 @@ export class EphemeralOrchestrator extends EventEmitter {
    */
   private extractPriorities(systemStatus: SystemStatus): TaskPriority[] {
     const priorities: TaskPriority[] = [];
+    const now = Date.now();
 
-    // Prioritize blocked PRPs
-    systemStatus.activePRPs
-      .filter(prp => prp.blockers.length > 0)
-      .forEach(prp => {
+    // Single pass over PRPs; a PRP can qualify for more than one task kind
+    for (const prp of systemStatus.activePRPs) {
+      // Prioritize blocked PRPs
+      if (prp.blockers.length > 0) {
         priorities.push({
+          ...BLOCKED_TASK_TEMPLATE,
           prpId: prp.id,
           priority: 100 + prp.blockers.length, // High priority for blocked
-          urgency: 'critical',
-          estimatedTime: 30, // 30 minutes for unblocking
-          dependencies: [],
           agentRequirements: this.getRequiredAgentsForBlockers(prp.blockers)
         });
-      });
-
-    // Prioritize PRPs with active agents that are not making progress
-    systemStatus.activePRPs
-      .filter(prp => prp.currentAgent && !this.isMakingProgress(prp))
-      .forEach(prp => {
-        priorities.push({
-          prpId: prp.id,
-          priority: 80,
-          urgency: 'high',
-          estimatedTime: 60,
-          dependencies: [],
-          agentRequirements: [prp.currentAgent!]
-        });
-      });
+      }
 
-    // Add regular PRP tasks
-    systemStatus.activePRPs
-      .filter(prp => prp.status === 'implementation' && !prp.currentAgent)
-      .forEach(prp => {
+      if (prp.currentAgent) {
+        // Prioritize PRPs with active agents that are not making progress
+        if (!this.isMakingProgress(prp, now)) {
+          priorities.push({
+            ...STALLED_TASK_TEMPLATE,
+            prpId: prp.id,
+            priority: 80,
+            agentRequirements: [prp.currentAgent]
+          });
+        }
+      } else if (prp.status === 'implementation') {
+        // Add regular PRP tasks
         priorities.push({
+          ...IMPLEMENTATION_TASK_TEMPLATE,
           prpId: prp.id,
           priority: 50,
-          urgency: 'medium',
-          estimatedTime: 120,
-          dependencies: [],
           agentRequirements: this.getAgentRequirementsForPRP(prp)
         });
-      });
+      }
+    }
 
     // Sort by priority (highest first)
     return priorities.sort((a, b) => b.priority - a.priority);
@@ -205,20 +270,14 @@ export class EphemeralOrchestrator extends EventEmitter {
     const availableAgents = this.getAvailableAgents();
     const tokenStatus = ephemeralSignalSystem.getCurrentStatus().resourceStatus.tokens;
 
-    // Filter tasks that can be executed with current resources
-    const executableTasks = priorities.filter(task => {
-      // Check if required agents are available
-      const hasAgents = task.agentRequirements.every(req =>
-        availableAgents.some(agent => agent.type === req)
-      );
+    // Without enough tokens no task is executable
+    if (tokenStatus.percentage >= 90) return null;
 
-      // Check if we have enough tokens
-      const hasTokens = tokenStatus.percentage < 90;
-
-      return hasAgents && hasTokens;
-    });
-
-    return executableTasks.length > 0 ? (executableTasks[0] ?? null) : null;
+    // Pick the first task whose required agents are all available
+    const availableTypes = new Set(availableAgents.map(agent => agent.type));
+    return priorities.find(task =>
+      task.agentRequirements.every(req => availableTypes.has(req))
+    ) ?? null;
   }
 
   /**
@@ -227,7 +286,7 @@ export class EphemeralOrchestrator extends EventEmitter {
   private async executeTask(task: TaskPriority, systemStatus: SystemStatus): Promise<void> {
     if (!this.currentCycle) return;
 
-    logger.info('EphemeralOrchestrator', `Executing task for PRP ${task.prpId} with priority ${task.priority}`);
+    logger.info('EphemeralOrchestrator', 'Executing task for PRP', { prpId: task.prpId, priority: task.priority });
 
     try {
       // Step 1: Checkout to worktree
@@ -250,10 +309,10 @@ export class EphemeralOrchestrator extends EventEmitter {
       this.currentCycle.currentTask = task;
       this.currentCycle.completedTasks.push(task.prpId);
 
-      logger.info('orchestrator', `Task completed for PRP ${task.prpId}`);
+      logger.info('orchestrator', 'Task completed for PRP', { prpId: task.prpId });
 
     } catch (error) {
-      logger.error('orchestrator', `Task execution failed for PRP ${task.prpId}`, error instanceof Error ? error : new Error(String(error)), {
+      logger.error('orchestrator', 'Task execution failed for PRP', error instanceof Error ? error : new Error(String(error)), {
         prpId: task.prpId
       });
 
@@ -276,7 +335,7 @@ export class EphemeralOrchestrator extends EventEmitter {
       createIfMissing: true
     });
 
-    logger.debug('EphemeralOrchestrator', `Checked out worktree for PRP ${prpId}`);
+    logger.debug('EphemeralOrchestrator', 'Checked out worktree for PRP', { prpId });
   }
 
   /**
@@ -296,7 +355,7 @@ export class EphemeralOrchestrator extends EventEmitter {
       source: 'main'
     });
 
-    logger.debug('EphemeralOrchestrator', `Checked out branch ${branchName}`);
+    logger.debug('EphemeralOrchestrator', 'Checked out branch', { branchName });
   }
 
   /**
@@ -380,7 +439,7 @@ Execute this task efficiently and report progress through signals.
       pid: agentResult.pid
     });
 
-    logger.info('orchestrator', `Spawned ${agentType} agent ${agentResult.id} for PRP ${prpId}`);
+    logger.info('orchestrator', 'Spawned agent for PRP', { agentType, agentId: agentResult.id, prpId });
 
     return agentResult;
   }
@@ -406,7 +465,7 @@ Execute this task efficiently and report progress through signals.
               break;
 
             case '[Bb]': // Blocker
-              logger.warn('orchestrator', `Agent ${agent.id} encountered blocker for PRP ${prpId}`);
+              logger.warn('orchestrator', 'Agent encountered blocker for PRP', { agentId: agent.id, prpId });
               // Continue monitoring - orchestrator will handle blockers in next cycle
               break;
 
@@ -429,99 +488,116 @@ Execute this task efficiently and report progress through signals.
   private handleSignal(signal: EphemeralSignal): void {
     if (!this.currentCycle) return;
 
-    logger.info('orchestrator', `Handling signal: ${signal.type}`, {
+    logger.info('orchestrator', 'Handling signal', {
       signalId: signal.id,
       type: signal.type,
       priority: signal.priority
     });
 
     // Route to appropriate handler based on signal type
-    switch (signal.type) {
-      case 'user':
-        this.handleUserSignal(signal);
-        break;
-      case 'emergency':
-        this.handleEmergencySignal(signal);
-        break;
-      case 'admin':
-        this.handleAdminSignal(signal);
-        break;
-      case 'development':
-        this.handleDevelopmentSignal(signal);
-        break;
-      default:
-        logger.warn('orchestrator', `Unknown signal type: ${signal.type}`, {
-          signalId: signal.id,
-          type: signal.type
-        });
+    const handler = this.signalHandlers.get(signal.type);
+    if (!handler) {
+      logger.warn('orchestrator', 'Unknown signal type', {
+        signalId: signal.id,
+        type: signal.type
+      });
+      return;
     }
+
+    handler(signal, this.parseSignalPayload(signal));
+  }
+
+  /**
+   * Extract the payload fields used by the signal handlers
+   */
+  private parseSignalPayload(signal: EphemeralSignal): SignalPayload {
+    const data = signal.data as { message?: string } | null | undefined;
+    return {
+      message: data?.message ?? ''
+    };
   }
 
   /**
    * Handle user signal
    */
-  private handleUserSignal(signal: EphemeralSignal): void {
+  private handleUserSignal(payload: SignalPayload): void {
     if (!this.currentCycle) return;
 
-    const signalData = signal.data as { message: string };
     const interruption: UserInterruption = {
-      id: HashUtils.generateId(),
+      id: HashUtils.generateSequentialId('interruption'),
       timestamp: new Date(),
       type: 'direct_command',
-      message: signalData.message,
+      message: payload.message,
       responseRequired: false
     };
 
     this.currentCycle.userInterruptions.push(interruption);
 
     // Process user command directly
-    this.processUserCommand(signalData.message);
+    this.processUserCommand(payload.message);
 
-    logger.info('orchestrator', `Processed user command: ${signalData.message}`);
+    logger.info('orchestrator', 'Processed user command', { message: payload.message });
   }
 
   /**
    * Process user command directly
    */
-  private async processUserCommand(command: string): Promise<void> {
+  private processUserCommand(command: string): void {
     // Parse and execute user command
     // This would involve command parsing and tool execution
-    logger.debug('EphemeralOrchestrator', `Executing user command: ${command}`);
+    logger.debug('EphemeralOrchestrator', 'Executing user command', { command });
   }
 
   /**
    * Handle emergency signal
    */
-  private handleEmergencySignal(signal: EphemeralSignal): void {
-    const signalData = signal.data as { message: string };
-    logger.error('orchestrator', `Emergency signal received: ${JSON.stringify(signal.data)}`);
+  private handleEmergencySignal(signal: EphemeralSignal, payload: SignalPayload): void {
+    logger.error('orchestrator', 'Emergency signal received', undefined, { data: signal.data });
 
     // Trigger immediate user notification
-    this.notifyAdmin('Emergency', signalData.message, true);
+    this.runInBackground(this.notifyAdmin('Emergency', payload.message, true), 'emergency admin notification');
   }
 
   /**
    * Handle admin signal
    */
-  private handleAdminSignal(signal: EphemeralSignal): void {
-    const signalData = signal.data as { message: string };
-    logger.warn('orchestrator', `Admin signal received: ${JSON.stringify(signal.data)}`);
+  private handleAdminSignal(signal: EphemeralSignal, payload: SignalPayload): void {
+    logger.warn('orchestrator', 'Admin signal received', { data: signal.data });
 
     // Trigger admin notification
-    this.notifyAdmin('Admin Action Required', signalData.message, true);
+    this.runInBackground(this.notifyAdmin('Admin Action Required', payload.message, true), 'admin notification');
   }
 
   /**
    * Handle development signal
    */
   private handleDevelopmentSignal(signal: EphemeralSignal): void {
-    logger.debug('EphemeralOrchestrator', `Development signal: ${signal.type} from ${signal.source}`);
+    logger.debug('EphemeralOrchestrator', 'Development signal', { type: signal.type, source: signal.source });
 
     // Update system status and continue cycle
     this.updateSystemStatusFromSignal(signal);
 
     // Continue orchestration cycle
-    setTimeout(() => this.processEphemeralSignal(), 1000);
+    setTimeout(() => {
+      this.processEphemeralSignal().catch(error => {
+        logger.error('orchestrator', 'Ephemeral signal processing failed', error instanceof Error ? error : new Error(String(error)));
+      });
+    }, 1000);
+  }
+
+  /**
+   * Keep a reference to a fire-and-forget task until it settles and log its failure
+   */
+  private runInBackground(task: Promise<void>, description: string): void {
+    const tracked: Promise<void> = task
+      .catch(error => {
+        logger.error('orchestrator', 'Background task failed', error instanceof Error ? error : new Error(String(error)), { description });
+      })
+      .finally(() => {
+        this.backgroundTasks.delete(tracked);
+      });
+
+    this.backgroundTasks.add(tracked);
   }
 
   /**
@@ -559,45 +635,25 @@ Execute this task efficiently and report progress through signals.
       .filter(agent => agent.status === 'idle');
   }
 
-  private isMakingProgress(prp: PRPStatus): boolean {
+  private isMakingProgress(prp: PRPStatus, now: number): boolean {
     // Check if PRP is making progress based on last update and progress percentage
-    const timeSinceUpdate = Date.now() - prp.lastUpdate.getTime();
+    const timeSinceUpdate = now - prp.lastUpdate.getTime();
     return timeSinceUpdate < 300000 && prp.progress > 0; // 5 minutes
   }
 
-  private getRequiredAgentsForBlockers(blockers: string[]): string[] {
-    // Analyze blockers and determine required agent types
-    const agentTypes: string[] = [];
-
-    if (blockers.some(b => b.includes('technical') || b.includes('implementation'))) {
-      agentTypes.push('robo-developer');
+  private getRequiredAgentsForBlockers(blockers: string[]): readonly string[] {
+    // Scan all blockers once and fold the matched keywords into an agent bitmask
+    let mask = 0;
+    for (const match of blockers.join('\n').matchAll(BLOCKER_KEYWORD_PATTERN)) {
+      mask |= BLOCKER_KEYWORD_BITS[match[0]];
     }
 
-    if (blockers.some(b => b.includes('test') || b.includes('quality'))) {
-      agentTypes.push('robo-aqa');
-    }
-
-    if (blockers.some(b => b.includes('analysis') || b.includes('research'))) {
-      agentTypes.push('robo-system-analyst');
-    }
-
-    return agentTypes;
+    return BLOCKER_AGENTS_BY_MASK[mask];
   }
 
-  private getAgentRequirementsForPRP(prp: PRPStatus): string[] {
+  private getAgentRequirementsForPRP(prp: PRPStatus): readonly string[] {
     // Determine agent requirements based on PRP status
-    switch (prp.status) {
-      case 'planning':
-        return ['robo-system-analyst'];
-      case 'implementation':
-        return ['robo-developer'];
-      case 'testing':
-        return ['robo-aqa'];
-      case 'review':
-        return ['robo-system-analyst', 'robo-aqa'];
-      default:
-        return ['robo-developer'];
-    }
+    return PRP_STATUS_AGENT_REQUIREMENTS[prp.status] ?? DEFAULT_AGENT_REQUIREMENTS;
   }
 
   private extractAgentStatusFromSignal(signal: EphemeralSignal): Partial<AgentStatus> {
@@ -630,6 +686,9 @@ Execute this task efficiently and report progress through signals.
 
     this.isRunning = false;
 
+    // Let in-flight admin notifications settle before ending the cycle
+    await Promise.all(this.backgroundTasks);
+
     if (this.currentCycle) {
       const cycleId = this.currentCycle.cycleId;
       ephemeralSignalSystem.endCycle(cycleId);
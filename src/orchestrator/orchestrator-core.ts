@@ -16,6 +16,28 @@ import { createLayerLogger, HashUtils } from '../shared';
 
 const logger = createLayerLogger('orchestrator');
 
+/** Guideline applied per signal type */
+const SIGNAL_GUIDELINES: ReadonlyMap<string, string> = new Map([
+  ['pr', 'github-pr-guideline'],
+  ['op', 'progress-update-guideline'],
+  ['tt', 'testing-guideline'],
+  ['Qb', 'quality-bug-guideline'],
+  ['af', 'question-guideline'],
+  ['At', 'attention-guideline'],
+  ['Bb', 'blocker-guideline']
+]);
+
+/** Tools every signal gets */
+const BASE_TOOLS: readonly string[] = ['read_file', 'write_file', 'list_directory'];
+
+/** Extra tools per signal type */
+const SIGNAL_SPECIFIC_TOOLS: ReadonlyMap<string, readonly string[]> = new Map([
+  ['pr', ['github_api', 'git_commands']],
+  ['tt', ['test_runner', 'coverage_analyzer']],
+  ['Qb', ['code_analyzer', 'lint_checker']],
+  ['af', ['web_search', 'documentation_reader']]
+]);
+
 /**
  * Orchestrator Core - Central coordination with LLM-based decision making
  */
@@ -238,14 +260,6 @@ export class OrchestratorCore extends EventEmitter {
     const startTime = Date.now();
 
     try {
-      // 1. Build context for the signal
-      const context = await this.contextManager.buildContext(signal, this.state);
-
-      // 2. Determine appropriate guideline and tools
-      await this.determineGuideline(signal);
-      const requiredTools = await this.determineRequiredTools(signal, 'general-guideline');
-
-      // 3. Generate Chain of Thought
       const processingContext: ProcessingContext = {
         signals: [signal],
         availableAgents: Array.from(this.state.activeAgents.values()).map(agent => ({
@@ -263,7 +277,14 @@ export class OrchestratorCore extends EventEmitter {
         constraints: []
       };
 
-      const cot = await this.cotProcessor.generateCoT(signal, processingContext, 'general-guideline');
+      // 1-3. Build context, determine guideline and tools, and generate Chain of Thought.
+      // These steps do not depend on each other, so they run concurrently.
+      const [context, , requiredTools, cot] = await Promise.all([
+        this.contextManager.buildContext(signal, this.state),
+        this.determineGuideline(signal),
+        this.determineRequiredTools(signal, 'general-guideline'),
+        this.cotProcessor.generateCoT(signal, processingContext, 'general-guideline')
+      ]);
 
       // 4. Execute tool calls based on CoT
       const toolResults = await this.executeToolCalls(cot, requiredTools);
@@ -310,34 +331,14 @@ export class OrchestratorCore extends EventEmitter {
    * Determine appropriate guideline for signal
    */
   private async determineGuideline(_signal: Signal): Promise<string> {
-    // Map signal types to guidelines
-    const signalGuidelines: Record<string, string> = {
-      'pr': 'github-pr-guideline',
-      'op': 'progress-update-guideline',
-      'tt': 'testing-guideline',
-      'Qb': 'quality-bug-guideline',
-      'af': 'question-guideline',
-      'At': 'attention-guideline',
-      'Bb': 'blocker-guideline'
-    };
-
-    return signalGuidelines[_signal.type] || 'general-guideline';
+    return SIGNAL_GUIDELINES.get(_signal.type) || 'general-guideline';
   }
 
   /**
    * Determine required tools for signal processing
    */
   private async determineRequiredTools(_signal: Signal, _guideline: string): Promise<Tool[]> {
-    const baseTools = ['read_file', 'write_file', 'list_directory'];
-
-    const signalSpecificTools: Record<string, string[]> = {
-      'pr': ['github_api', 'git_commands'],
-      'tt': ['test_runner', 'coverage_analyzer'],
-      'Qb': ['code_analyzer', 'lint_checker'],
-      'af': ['web_search', 'documentation_reader']
-    };
-
-    const toolNames = [...baseTools, ...(signalSpecificTools[_signal.type] || [])];
+    const toolNames = [...BASE_TOOLS, ...(SIGNAL_SPECIFIC_TOOLS.get(_signal.type) || [])];
 
     return toolNames
       .map(name => this.toolRegistry.getTool(name))
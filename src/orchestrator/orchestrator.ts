@@ -104,6 +104,19 @@ interface Guideline {
 
 const logger = createLayerLogger('orchestrator');
 
+/** Execution step type per decision action type */
+const ACTION_STEP_TYPES: ReadonlyMap<string, ExecutionStep['type']> = new Map<string, ExecutionStep['type']>([
+  ['spawn_agent', 'agent_task'],
+  ['send_message', 'tool_call'],
+  ['execute_command', 'tool_call'],
+  ['call_tool', 'tool_call'],
+  ['create_note', 'tool_call'],
+  ['update_prp', 'tool_call'],
+  ['create_signal', 'tool_call'],
+  ['wait', 'wait'],
+  ['escalate', 'decision']
+]);
+
 /**
  * ♫ Orchestrator - The conductor of AI agents
  */
@@ -346,7 +359,8 @@ export class Orchestrator extends EventEmitter {
         processingTime: 120000,
         agentResponse: 30000,
         errorRate: 0.2
-      }
+      },
+      simulateLatency: false
     };
 
     return { ...defaultConfig, ...overrides };
@@ -719,36 +733,53 @@ export class Orchestrator extends EventEmitter {
     try {
       plan.status = 'in_progress';
 
-      // Execute steps in dependency order
-      for (const step of plan.steps) {
-        if (!this.canExecuteStep(step, plan)) {
-          continue;
+      // Execute steps in dependency waves; steps within a wave run concurrently
+      let completedCount = 0;
+      let wave = this.collectReadySteps(plan);
+      while (wave.length > 0) {
+        const waveResults = await Promise.all(wave.map(step => this.executeStep(step, decisionId)));
+
+        for (const [index, result] of waveResults.entries()) {
+          const step = wave[index];
+          results.push(result);
+          if (result.status === 'completed') {
+            completedCount++;
+          }
+
+          // Update progress
+          plan.progress = Math.round((completedCount / plan.steps.length) * 100);
+
+          // Check if any critical step failed
+          if (result.status === 'failed' && this.isCriticalStep(step)) {
+            throw new Error(`Critical step ${step.name} failed: ${result.error}`);
+          }
         }
 
-        const result = await this.executeStep(step, decisionId);
-        results.push(result);
-
-        // Update progress
-        plan.progress = Math.round((results.filter(r => r.status === 'completed').length / plan.steps.length) * 100);
-
-        // Check if any critical step failed
-        if (result.status === 'failed' && this.isCriticalStep(step)) {
-          throw new Error(`Critical step ${step.name} failed: ${result.error}`);
-        }
+        wave = this.collectReadySteps(plan);
       }
 
       plan.status = 'completed';
-      plan.endTime = new Date();
+      const endTime = new Date();
+      plan.endTime = endTime;
+
+      // Split results into achieved goals and blocked items in one pass
+      const achievedGoals: string[] = [];
+      const blockedItems: string[] = [];
+      for (const r of results) {
+        if (r.status === 'completed') {
+          const result = r.result as { goal?: string } | undefined;
+          achievedGoals.push(result?.goal || 'Task completed');
+        } else if (r.status === 'failed') {
+          blockedItems.push(r.error || 'Task failed');
+        }
+      }
 
       // Create outcome
       const outcome: DecisionOutcome = {
-        success: results.every(r => r.status === 'completed'),
-        summary: this.generateOutcomeSummary(results),
-        achievedGoals: results.filter(r => r.status === 'completed').map(r => {
-          const result = r.result as { goal?: string } | undefined;
-          return result?.goal || 'Task completed';
-        }),
-        blockedItems: results.filter(r => r.status === 'failed').map(r => r.error || 'Task failed'),
+        success: achievedGoals.length === results.length,
+        summary: this.generateOutcomeSummary(achievedGoals.length, blockedItems.length),
+        achievedGoals,
+        blockedItems,
         nextActions: this.getNextActions(results),
         recommendations: this.generateRecommendations(results),
         lessons: this.extractLessons(results),
@@ -757,7 +788,7 @@ export class Orchestrator extends EventEmitter {
           agentsCoordinated: this.getActiveAgentCount(),
           toolsUsed: this.countToolsUsed(results),
           tokenConsumed: this.calculateTokenUsage(results),
-          timeSpent: Date.now() - startTime
+          timeSpent: endTime.getTime() - startTime
         }
       };
 
@@ -902,8 +933,9 @@ export class Orchestrator extends EventEmitter {
    * Simulate model call (placeholder for actual implementation)
    */
   private async simulateModelCall(prompt: string, _options: unknown): Promise<unknown> {
-    // Simulate API delay
-    await new Promise(resolve => setTimeout(resolve, 200 + Math.random() * 300));
+    if (this.config.simulateLatency) {
+      await new Promise(resolve => setTimeout(resolve, 200 + Math.random() * 300));
+    }
 
     // Generate mock response based on prompt content
     if (prompt.includes('chain of thought')) {
@@ -1100,18 +1132,7 @@ export class Orchestrator extends EventEmitter {
    * Get action type from string
    */
   private getActionType(type: string): ExecutionStep['type'] {
-    const typeMap: Record<string, ExecutionStep['type']> = {
-      'spawn_agent': 'agent_task',
-      'send_message': 'tool_call',
-      'execute_command': 'tool_call',
-      'call_tool': 'tool_call',
-      'create_note': 'tool_call',
-      'update_prp': 'tool_call',
-      'create_signal': 'tool_call',
-      'wait': 'wait',
-      'escalate': 'decision'
-    };
-    return typeMap[type] || 'tool_call';
+    return ACTION_STEP_TYPES.get(type) || 'tool_call';
   }
 
   /**
@@ -1176,6 +1197,25 @@ export class Orchestrator extends EventEmitter {
     return true;
   }
 
+  /**
+   * Steps that can start now: dependencies completed and at most one task per assigned agent
+   */
+  private collectReadySteps(plan: ExecutionPlan): ExecutionStep[] {
+    const assignedAgents = new Set<string>();
+    return plan.steps.filter(step => {
+      if (!this.canExecuteStep(step, plan)) {
+        return false;
+      }
+      if (step.type === 'agent_task' && step.assignedTo) {
+        if (assignedAgents.has(step.assignedTo)) {
+          return false;
+        }
+        assignedAgents.add(step.assignedTo);
+      }
+      return true;
+    });
+  }
+
   /**
    * Execute a single step
    */
@@ -1257,7 +1297,9 @@ export class Orchestrator extends EventEmitter {
 
     // This would coordinate with the actual agent
     // For now, simulate task execution
-    await new Promise(resolve => setTimeout(resolve, 1000 + Math.random() * 2000));
+    if (this.config.simulateLatency) {
+      await new Promise(resolve => setTimeout(resolve, 1000 + Math.random() * 2000));
+    }
 
     return {
       success: true,
@@ -1309,10 +1351,7 @@ export class Orchestrator extends EventEmitter {
   /**
    * Generate outcome summary
    */
-  private generateOutcomeSummary(results: ActionResult[]): string {
-    const completed = results.filter(r => r.status === 'completed').length;
-    const failed = results.filter(r => r.status === 'failed').length;
-
+  private generateOutcomeSummary(completed: number, failed: number): string {
     return `Execution completed: ${completed} successful, ${failed} failed`;
   }
 
@@ -12,6 +12,9 @@ import type { NodeJS } from 'node';
 
 const logger = createLayerLogger('signal-aggregation');
 
+/** Signal types that make a batch require action */
+const ACTION_REQUIRED_SIGNALS: ReadonlySet<string> = new Set(['bb', 'af', 'gg', 'oa', 'aa', 'ic', 'er']);
+
 /**
  * Signal aggregation strategy
  */
@@ -231,17 +234,23 @@ export class SignalAggregationSystem {
     immediateDelivery: boolean;
     ruleApplied?: string;
   } {
-    logger.debug('SignalAggregation', 'Adding signal to aggregation', {
-      signalId: signal.id,
-      type: signal.type,
-      priority: signal.priority
-    });
+    // Per-signal debug metadata is only built when debug logging is on
+    const debugEnabled = logger.isDebugEnabled();
+    if (debugEnabled) {
+      logger.debug('SignalAggregation', 'Adding signal to aggregation', {
+        signalId: signal.id,
+        type: signal.type,
+        priority: signal.priority
+      });
+    }
 
     // Find applicable aggregation rule
     const applicableRule = this.findApplicableRule(signal);
 
     if (!applicableRule) {
-      logger.debug('SignalAggregation', 'No applicable rule found, using default');
+      if (debugEnabled) {
+        logger.debug('SignalAggregation', 'No applicable rule found, using default');
+      }
       return { immediateDelivery: false };
     }
 
@@ -371,12 +380,14 @@ export class SignalAggregationSystem {
 
     buffer.push(signal);
 
-    logger.debug('SignalAggregation', 'Signal added to buffer', {
-      signalId: signal.id,
-      bufferKey,
-      bufferSize: buffer.length,
-      rule: rule.name
-    });
+    if (logger.isDebugEnabled()) {
+      logger.debug('SignalAggregation', 'Signal added to buffer', {
+        signalId: signal.id,
+        bufferKey,
+        bufferSize: buffer.length,
+        rule: rule.name
+      });
+    }
 
     // Check if buffer should be processed immediately
     if (buffer.length >= rule.maxSignals) {
@@ -422,12 +433,24 @@ export class SignalAggregationSystem {
    * Check if signal is duplicate in buffer
    */
   private isDuplicateSignal(signal: Signal, buffer: Signal[]): boolean {
-    return buffer.some(existingSignal =>
-      existingSignal.type === signal.type &&
-      existingSignal.source === signal.source &&
-      existingSignal.priority === signal.priority &&
-      JSON.stringify(existingSignal.data) === JSON.stringify(signal.data)
-    );
+    // Serialize the incoming payload at most once, and only when a candidate needs it
+    let serializedData: string | undefined;
+    return buffer.some(existingSignal => {
+      if (
+        existingSignal.type !== signal.type ||
+        existingSignal.source !== signal.source ||
+        existingSignal.priority !== signal.priority
+      ) {
+        return false;
+      }
+      if (existingSignal.data === signal.data) {
+        return true;
+      }
+      if (serializedData === undefined) {
+        serializedData = JSON.stringify(signal.data);
+      }
+      return JSON.stringify(existingSignal.data) === serializedData;
+    });
   }
 
   /**
@@ -550,30 +573,51 @@ export class SignalAggregationSystem {
    * Create batch metadata
    */
   private createBatchMetadata(signals: Signal[], strategy: AggregationStrategy): SignalBatch['metadata'] {
-    const prpIds = [...new Set(signals.map(s => s.data?.prpId).filter(Boolean))];
-    const agentTypes = [...new Set(signals.map(s => s.metadata?.agent).filter(Boolean))];
-    const signalTypes = [...new Set(signals.map(s => s.type))];
-    const priorities = signals.map(s => s.priority);
-    const timestamps = signals.map(s => s.timestamp);
+    // Collect unique ids in first-seen order, priorities and time bounds in a single pass
+    const prpIds = new Set<string>();
+    const agentTypes = new Set<string>();
+    const signalTypes = new Set<string>();
+    const priorities: number[] = [];
+    let oldestTime = Infinity;
+    let newestTime = -Infinity;
+    let maxPriority = -Infinity;
+    let requiresAction = false;
+
+    for (const signal of signals) {
+      const prpId = signal.data?.prpId;
+      if (prpId) {
+        prpIds.add(prpId as string);
+      }
+      const agent = signal.metadata?.agent;
+      if (agent) {
+        agentTypes.add(agent);
+      }
+      signalTypes.add(signal.type);
+      priorities.push(signal.priority);
+      maxPriority = Math.max(maxPriority, signal.priority);
+
+      const time = signal.timestamp.getTime();
+      oldestTime = Math.min(oldestTime, time);
+      newestTime = Math.max(newestTime, time);
 
-    const oldestSignal = new Date(Math.min(...timestamps.map(t => t.getTime())));
-    const newestSignal = new Date(Math.max(...timestamps.map(t => t.getTime())));
+      // Check if batch requires action
+      if (ACTION_REQUIRED_SIGNALS.has(signal.type)) {
+        requiresAction = true;
+      }
+    }
 
-    // Check if batch requires action
-    const requiresAction = signals.some(s =>
-      ['bb', 'af', 'gg', 'oa', 'aa', 'ic', 'er'].includes(s.type)
-    );
+    const oldestSignal = new Date(oldestTime);
+    const newestSignal = new Date(newestTime);
 
     // Calculate escalation level
-    const maxPriority = Math.max(...priorities);
     const escalationLevel = maxPriority >= 8 ? 3 : maxPriority >= 6 ? 2 : maxPriority >= 4 ? 1 : 0;
 
     return {
       createdAt: new Date(),
       signalCount: signals.length,
-      prpIds: prpIds as string[],
-      agentTypes: agentTypes as string[],
-      signalTypes,
+      prpIds: [...prpIds],
+      agentTypes: [...agentTypes],
+      signalTypes: [...signalTypes],
       priorities,
       oldestSignal,
       newestSignal,
@@ -28,6 +28,103 @@ interface ToolDefinition {
 
 const execAsync = promisify(exec);
 
+/** Names of every tool this implementation can execute */
+const AVAILABLE_TOOLS: readonly string[] = [
+  'readFile',
+  'writeFile',
+  'listFiles',
+  'gitStatus',
+  'gitDiff',
+  'gitLog',
+  'gitAdd',
+  'gitCommit',
+  'gitPush',
+  'executeCommand',
+  'makeRequest'
+];
+
+/** Tool definitions used for prompting, by tool name */
+const TOOL_DEFINITIONS: Readonly<Record<string, ToolDefinition>> = {
+  readFile: {
+    name: 'readFile',
+    description: 'Read the contents of a file',
+    parameters: {
+      type: 'object',
+      properties: {
+        filePath: { type: 'string', description: 'Path to the file to read' }
+      },
+      required: ['filePath']
+    }
+  },
+
+  writeFile: {
+    name: 'writeFile',
+    description: 'Write content to a file',
+    parameters: {
+      type: 'object',
+      properties: {
+        filePath: { type: 'string', description: 'Path to the file to write' },
+        content: { type: 'string', description: 'Content to write to the file' }
+      },
+      required: ['filePath', 'content']
+    }
+  },
+
+  listFiles: {
+    name: 'listFiles',
+    description: 'List files in a directory',
+    parameters: {
+      type: 'object',
+      properties: {
+        directoryPath: { type: 'string', description: 'Path to the directory to list' },
+        pattern: { type: 'string', description: 'Optional pattern to filter files' }
+      },
+      required: ['directoryPath']
+    }
+  },
+
+  gitStatus: {
+    name: 'gitStatus',
+    description: 'Get git repository status',
+    parameters: {
+      type: 'object',
+      properties: {
+        repositoryPath: { type: 'string', description: 'Path to git repository (optional)' }
+      },
+      required: []
+    }
+  },
+
+  executeCommand: {
+    name: 'executeCommand',
+    description: 'Execute a shell command',
+    parameters: {
+      type: 'object',
+      properties: {
+        command: { type: 'string', description: 'Command to execute' },
+        workingDir: { type: 'string', description: 'Working directory for command (optional)' }
+      },
+      required: ['command']
+    }
+  },
+
+  makeRequest: {
+    name: 'makeRequest',
+    description: 'Make an HTTP request',
+    parameters: {
+      type: 'object',
+      properties: {
+        url: { type: 'string', description: 'URL to request' },
+        method: { type: 'string', enum: ['GET', 'POST', 'PUT', 'DELETE', 'PATCH'], description: 'HTTP method' },
+        headers: { type: 'object', description: 'Request headers' },
+        body: { type: 'string', description: 'Request body' },
+        timeout: { type: 'number', description: 'Request timeout in milliseconds' }
+      },
+      required: ['url']
+    }
+  }
+};
+
 /**
  * Implements all available tools for orchestrator operations
  */
@@ -66,26 +163,30 @@ export class ToolImplementation {
   }
 
   async listFiles(directoryPath: string, pattern?: string): Promise<string[]> {
+    const files: string[] = [];
+    await this.collectFiles(directoryPath, pattern, files);
+    return files;
+  }
+
+  /**
+   * Append matching files under a directory to a shared result list
+   */
+  private async collectFiles(directoryPath: string, pattern: string | undefined, files: string[]): Promise<void> {
     try {
       const fullPath = path.resolve(this.workingDirectory, directoryPath);
       const entries = await fs.readdir(fullPath, { withFileTypes: true });
 
-      let files: string[] = [];
-
       for (const entry of entries) {
         const relativePath = path.join(directoryPath, entry.name);
 
         if (entry.isDirectory()) {
-          const subFiles = await this.listFiles(relativePath, pattern);
-          files = files.concat(subFiles);
+          await this.collectFiles(relativePath, pattern, files);
         } else if (entry.isFile()) {
           if (!pattern || entry.name.includes(pattern)) {
             files.push(relativePath);
           }
         }
       }
-
-      return files;
     } catch (error) {
       throw new Error(`Failed to list files in ${directoryPath}: ${(error as Error).message}`);
     }
@@ -350,106 +451,13 @@ export class ToolImplementation {
    * Get list of available tools
    */
   getAvailableTools(): string[] {
-    return [
-      'readFile',
-      'writeFile',
-      'listFiles',
-      'gitStatus',
-      'gitDiff',
-      'gitLog',
-      'gitAdd',
-      'gitCommit',
-      'gitPush',
-      'executeCommand',
-      'makeRequest'
-    ];
+    return [...AVAILABLE_TOOLS];
   }
 
   /**
    * Get tool definition for prompting
    */
   getToolDefinition(toolName: string) : unknown {
-    const definitions: Record<string, ToolDefinition> = {
-      readFile: {
-        name: 'readFile',
-        description: 'Read the contents of a file',
-        parameters: {
-          type: 'object',
-          properties: {
-            filePath: { type: 'string', description: 'Path to the file to read' }
-          },
-          required: ['filePath']
-        }
-      },
-
-      writeFile: {
-        name: 'writeFile',
-        description: 'Write content to a file',
-        parameters: {
-          type: 'object',
-          properties: {
-            filePath: { type: 'string', description: 'Path to the file to write' },
-            content: { type: 'string', description: 'Content to write to the file' }
-          },
-          required: ['filePath', 'content']
-        }
-      },
-
-      listFiles: {
-        name: 'listFiles',
-        description: 'List files in a directory',
-        parameters: {
-          type: 'object',
-          properties: {
-            directoryPath: { type: 'string', description: 'Path to the directory to list' },
-            pattern: { type: 'string', description: 'Optional pattern to filter files' }
-          },
-          required: ['directoryPath']
-        }
-      },
-
-      gitStatus: {
-        name: 'gitStatus',
-        description: 'Get git repository status',
-        parameters: {
-          type: 'object',
-          properties: {
-            repositoryPath: { type: 'string', description: 'Path to git repository (optional)' }
-          },
-          required: []
-        }
-      },
-
-      executeCommand: {
-        name: 'executeCommand',
-        description: 'Execute a shell command',
-        parameters: {
-          type: 'object',
-          properties: {
-            command: { type: 'string', description: 'Command to execute' },
-            workingDir: { type: 'string', description: 'Working directory for command (optional)' }
-          },
-          required: ['command']
-        }
-      },
-
-      makeRequest: {
-        name: 'makeRequest',
-        description: 'Make an HTTP request',
-        parameters: {
-          type: 'object',
-          properties: {
-            url: { type: 'string', description: 'URL to request' },
-            method: { type: 'string', enum: ['GET', 'POST', 'PUT', 'DELETE', 'PATCH'], description: 'HTTP method' },
-            headers: { type: 'object', description: 'Request headers' },
-            body: { type: 'string', description: 'Request body' },
-            timeout: { type: 'number', description: 'Request timeout in milliseconds' }
-          },
-          required: ['url']
-        }
-      }
-    };
-
-    return definitions[toolName];
+    return TOOL_DEFINITIONS[toolName];
   }
 }
\ No newline at end of file
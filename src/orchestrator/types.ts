@@ -20,6 +20,7 @@ export interface OrchestratorConfig {
   agents: AgentManagementConfig;
   prompts: OrchestratorPrompts;
   decisionThresholds: DecisionThresholds;
+  simulateLatency?: boolean; // add artificial delays to placeholder model and agent calls
 }
 
 export interface ContextPreservationConfig {
@@ -368,15 +368,17 @@ export class EnhancedGitMonitor {
         return allSignals;
       }
 
-      const commits = logOutput.split('\n');
+      const commits = logOutput.split('\n')
+        .map(commitLine => commitLine.split('|'))
+        .filter(([commit, message]) => commit && message);
 
-      for (const commitLine of commits) {
-        const [commit, message, author, dateStr] = commitLine.split('|');
-
-        if (!commit || !message) continue;
+      // Detect signals in all commit messages in one batch
+      const commitSignals = await this.signalDetector.detectSignalsBatch(
+        commits.map(([commit, message]) => ({ content: message, source: `commit:${commit}` }))
+      );
 
-        // Detect signals in commit message
-        const signals = await this.signalDetector.detectSignals(message, `commit:${commit}`);
+      for (const [index, [commit, , author, dateStr]] of commits.entries()) {
+        const signals = commitSignals[index] ?? [];
 
         // Add commit metadata to signals
         signals.forEach(signal => {
@@ -10,10 +10,29 @@ import { existsSync } from 'fs';
 import { join } from 'path';
 import { Signal } from '../shared/types';
 import { SignalDetectorImpl } from './signal-detector';
-import { createLayerLogger, HashUtils } from '../shared';
+import { createLayerLogger, HashUtils, PRPKeywordUtils } from '../shared';
 
 const logger = createLayerLogger('scanner');
 
+/** Status keywords in precedence order, see PRPKeywordUtils.findMarkedKeyword */
+const PRP_STATUSES: ReadonlyArray<EnhancedPRPMetadata['status']> = [
+  'planning', 'active', 'testing', 'review', 'completed', 'blocked', 'archived'
+];
+const STATUS_MARKERS = /(?:status: |## )(planning|active|testing|review|completed|blocked|archived)/g;
+
+/**
+ * Match a case-insensitive `keyword: value` field, running the regex only when the
+ * literal keyword appears in the lowercased text; most PRPs lack most fields
+ */
+const matchField = (content: string, contentLower: string, keyword: string, pattern: RegExp): RegExpMatchArray | null =>
+  contentLower.includes(keyword) ? content.match(pattern) : null;
+
+/** Whether every entry of `previous` still has its id somewhere in `next` */
+const containsAllIds = (previous: ReadonlyArray<{ id: string }>, next: ReadonlyArray<{ id: string }>): boolean => {
+  const nextIds = new Set(next.map(item => item.id));
+  return previous.every(item => nextIds.has(item.id));
+};
+
 export interface EnhancedPRPFile {
   path: string;
   name: string;
@@ -423,9 +442,9 @@ export class EnhancedPRPParser {
     const hasContentChanges = oldFile.content !== newContent;
     const hasMetadataChanges = JSON.stringify(oldFile.metadata) !== JSON.stringify(newMetadata);
     const hasSignalChanges = oldFile.signals.length !== newSignals.length ||
-      !oldFile.signals.every(s => newSignals.some(ns => ns.id === s.id));
+      !containsAllIds(oldFile.signals, newSignals);
     const hasRequirementChanges = oldFile.metadata.requirements.length !== newMetadata.requirements.length ||
-      !oldFile.metadata.requirements.every(r => newMetadata.requirements.some(nr => nr.id === r.id));
+      !containsAllIds(oldFile.metadata.requirements, newMetadata.requirements);
 
     if (hasContentChanges || hasMetadataChanges || hasSignalChanges || hasRequirementChanges) {
       changes.push({
@@ -526,7 +545,8 @@ export class EnhancedPRPParser {
     try {
       const cacheData = Object.fromEntries(this.cache);
       const cacheFile = join(this.cacheDirectory, 'prp-cache.json');
-      await writeFile(cacheFile, JSON.stringify(cacheData, null, 2));
+      // Machine-read cache, so skip pretty-printing
+      await writeFile(cacheFile, JSON.stringify(cacheData));
     } catch (error) {
       logger.warn('EnhancedPRPParser', 'Failed to persist cache to disk', {
         error: error instanceof Error ? error.message : String(error)
@@ -584,18 +604,21 @@ export class EnhancedPRPParser {
    */
   private extractEnhancedMetadata(content: string, _filePath: string, signals: Signal[]): EnhancedPRPMetadata {
     const lines = content.split('\n');
+    // Single-line and lowercased forms shared by the keyword extractors
+    const joined = lines.join(' ');
+    const joinedLower = joined.toLowerCase();
 
     // Extract basic metadata
     const title = this.extractTitle(lines);
-    const status = this.extractStatus(lines);
-    const priority = this.extractPriority(lines);
-    const assignedAgent = this.extractAssignedAgent(lines);
+    const status = this.extractStatus(joinedLower);
+    const priority = this.extractPriority(joinedLower);
+    const assignedAgent = this.extractAssignedAgent(joined, joinedLower);
     const requirements = this.extractEnhancedRequirements(lines);
     const acceptanceCriteria = this.extractEnhancedAcceptanceCriteria(lines);
     const estimatedTokens = this.estimateTokens(content);
-    const tags = this.extractTags(lines);
-    const dependencies = this.extractDependencies(lines);
-    const blockers = this.extractBlockers(lines);
+    const tags = this.extractTags(joined, joinedLower);
+    const dependencies = this.extractDependencies(joined, joinedLower);
+    const blockers = this.extractBlockers(joined, joinedLower);
 
     // Extract signal information
     const prpSignals: PRPSignal[] = signals.map(signal => ({
@@ -646,56 +669,24 @@ export class EnhancedPRPParser {
   }
 
   /**
-   * Extract status from PRP content
+   * Extract status from lowercased, space-joined PRP content
    */
-  private extractStatus(lines: string[]): EnhancedPRPMetadata['status'] {
-    const content = lines.join(' ').toLowerCase();
-
-    if (content.includes('status: planning') || content.includes('## planning')) {
-      return 'planning';
-    } else if (content.includes('status: active') || content.includes('## active')) {
-      return 'active';
-    } else if (content.includes('status: testing') || content.includes('## testing')) {
-      return 'testing';
-    } else if (content.includes('status: review') || content.includes('## review')) {
-      return 'review';
-    } else if (content.includes('status: completed') || content.includes('## completed')) {
-      return 'completed';
-    } else if (content.includes('status: blocked') || content.includes('## blocked')) {
-      return 'blocked';
-    } else if (content.includes('status: archived') || content.includes('## archived')) {
-      return 'archived';
-    }
-
-    return 'planning';
+  private extractStatus(content: string): EnhancedPRPMetadata['status'] {
+    return PRPKeywordUtils.findMarkedKeyword(content, STATUS_MARKERS, PRP_STATUSES) ?? 'planning';
   }
 
   /**
-   * Extract priority from PRP content
+   * Extract priority from lowercased, space-joined PRP content
    */
-  private extractPriority(lines: string[]): EnhancedPRPMetadata['priority'] {
-    const content = lines.join(' ').toLowerCase();
-
-    if (content.includes('priority: critical') || content.includes('## critical')) {
-      return 'critical';
-    } else if (content.includes('priority: high') || content.includes('## high')) {
-      return 'high';
-    } else if (content.includes('priority: medium') || content.includes('## medium')) {
-      return 'medium';
-    } else if (content.includes('priority: low') || content.includes('## low')) {
-      return 'low';
-    }
-
-    return 'medium';
+  private extractPriority(content: string): EnhancedPRPMetadata['priority'] {
+    return PRPKeywordUtils.findMarkedKeyword(content, PRPKeywordUtils.PRIORITY_MARKERS, PRPKeywordUtils.PRIORITIES) ?? 'medium';
   }
 
   /**
    * Extract assigned agent from PRP content
    */
-  private extractAssignedAgent(lines: string[]): string | undefined {
-    const content = lines.join(' ');
-
-    const match = content.match(/assigned agent[:\s]+([^\n\r]+)/i);
+  private extractAssignedAgent(content: string, contentLower: string): string | undefined {
+    const match = matchField(content, contentLower, 'assigned agent', /assigned agent[:\s]+([^\n\r]+)/i);
     return match ? match[1].trim() : undefined;
   }
 
@@ -765,12 +756,11 @@ export class EnhancedPRPParser {
   /**
    * Extract tags from PRP content
    */
-  private extractTags(lines: string[]): string[] {
-    const content = lines.join(' ');
+  private extractTags(content: string, contentLower: string): string[] {
     const tags: string[] = [];
 
     // Extract tags from various formats
-    const tagMatch = content.match(/tags?[:\s]+([^\n\r]+)/i);
+    const tagMatch = matchField(content, contentLower, 'tag', /tags?[:\s]+([^\n\r]+)/i);
     if (tagMatch) {
       const tagString = tagMatch[1];
       const tagList = tagString.split(/[,;\s]+/).map(tag => tag.trim().replace('#', ''));
@@ -783,11 +773,10 @@ export class EnhancedPRPParser {
   /**
    * Extract dependencies from PRP content
    */
-  private extractDependencies(lines: string[]): string[] {
-    const content = lines.join(' ');
+  private extractDependencies(content: string, contentLower: string): string[] {
     const dependencies: string[] = [];
 
-    const depMatch = content.match(/dependencies?[:\s]+([^\n\r]+)/i);
+    const depMatch = matchField(content, contentLower, 'dependenc', /dependencies?[:\s]+([^\n\r]+)/i);
     if (depMatch) {
       const depString = depMatch[1];
       const depList = depString.split(/[,;\s]+/).map(dep => dep.trim());
@@ -800,11 +789,10 @@ export class EnhancedPRPParser {
   /**
    * Extract blockers from PRP content
    */
-  private extractBlockers(lines: string[]): string[] {
-    const content = lines.join(' ');
+  private extractBlockers(content: string, contentLower: string): string[] {
     const blockers: string[] = [];
 
-    const blockMatch = content.match(/blockers?[:\s]+([^\n\r]+)/i);
+    const blockMatch = matchField(content, contentLower, 'blocker', /blockers?[:\s]+([^\n\r]+)/i);
     if (blockMatch) {
       const blockString = blockMatch[1];
       const blockList = blockString.split(/[,;\s]+/).map(block => block.trim());
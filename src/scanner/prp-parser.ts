@@ -1,5 +1,6 @@
 import { readFileSync, readdirSync, statSync, existsSync } from 'fs';
 import { join } from 'path';
+import { PRPKeywordUtils } from '../shared/utils';
 
 /**
  * PRP Parser - handles discovery and parsing of Product Requirement Prompts
@@ -52,6 +53,17 @@ export interface DetectedSignal {
   metadata?: Record<string, unknown>;
 }
 
+/** Status keywords in precedence order, as marked by `status: x` or a `## x` heading */
+const PRP_STATUSES: ReadonlyArray<PRPMetadata['status']> = ['planning', 'active', 'testing', 'review', 'completed', 'blocked'];
+const STATUS_MARKERS = /(?:status: |## )(planning|active|testing|review|completed|blocked)/g;
+
+/** Signal priorities by exact signal code; unlisted codes are low priority */
+const SIGNAL_PRIORITIES: ReadonlyMap<string, DetectedSignal['priority']> = new Map<string, DetectedSignal['priority']>([
+  ['AE', 'critical'], ['AA', 'critical'], ['OE', 'critical'], ['OA', 'critical'],
+  ['Bb', 'high'], ['OC', 'high'], ['OD', 'high'], ['AD', 'high'],
+  ['af', 'medium'], ['ap', 'medium'], ['op', 'medium'], ['oa', 'medium']
+]);
+
 /**
  * PRP Parser class
  */
@@ -119,11 +131,22 @@ export class PRPParser {
   extractSignals(content: string): DetectedSignal[] {
     const signals: DetectedSignal[] = [];
     const lines = content.split('\n');
+    let lineOffsets: number[] | null = null;
+
+    for (let index = 0; index < lines.length; index++) {
+      const line = lines[index];
+
+      // Signals open the line, so most lines are rejected without running the regex
+      if (line.charCodeAt(0) !== 91 /* [ */) {
+        continue;
+      }
 
-    lines.forEach((line, index) => {
       const match = line.match(this.SIGNAL_PATTERN);
       if (match) {
         const [, signalType, signalContent] = match;
+        if (!lineOffsets) {
+          lineOffsets = this.getLineOffsets(lines);
+        }
 
         signals.push({
           pattern: match[0],
@@ -131,11 +154,11 @@ export class PRPParser {
           content: (signalContent || '').trim(),
           line: index + 1,
           column: 0,
-          context: this.getContext(lines, index),
+          context: this.getContext(content, lines, lineOffsets, index),
           priority: this.determineSignalPriority(signalType || '')
         });
       }
-    });
+    }
 
     return signals;
   }
@@ -176,10 +199,11 @@ export class PRPParser {
    */
   private extractMetadata(content: string, _filePath: string): PRPMetadata {
     const lines = content.split('\n');
+    const joinedLower = lines.join(' ').toLowerCase();
     const metadata: PRPMetadata = {
       title: this.extractTitle(lines),
-      status: this.extractStatus(lines),
-      priority: this.extractPriority(lines),
+      status: this.extractStatus(joinedLower),
+      priority: this.extractPriority(joinedLower),
       signals: this.extractSignals(content),
       requirements: this.extractRequirements(lines),
       acceptanceCriteria: this.extractAcceptanceCriteria(lines),
@@ -203,45 +227,17 @@ export class PRPParser {
   }
 
   /**
-   * Extract status from PRP content
+   * Extract status from lowercased, space-joined PRP content
    */
-  private extractStatus(lines: string[]): PRPMetadata['status'] {
-    const content = lines.join(' ').toLowerCase();
-
-    if (content.includes('status: planning') || content.includes('## planning')) {
-      return 'planning';
-    } else if (content.includes('status: active') || content.includes('## active')) {
-      return 'active';
-    } else if (content.includes('status: testing') || content.includes('## testing')) {
-      return 'testing';
-    } else if (content.includes('status: review') || content.includes('## review')) {
-      return 'review';
-    } else if (content.includes('status: completed') || content.includes('## completed')) {
-      return 'completed';
-    } else if (content.includes('status: blocked') || content.includes('## blocked')) {
-      return 'blocked';
-    }
-
-    return 'planning';
+  private extractStatus(content: string): PRPMetadata['status'] {
+    return PRPKeywordUtils.findMarkedKeyword(content, STATUS_MARKERS, PRP_STATUSES) ?? 'planning';
   }
 
   /**
-   * Extract priority from PRP content
+   * Extract priority from lowercased, space-joined PRP content
    */
-  private extractPriority(lines: string[]): PRPMetadata['priority'] {
-    const content = lines.join(' ').toLowerCase();
-
-    if (content.includes('priority: critical') || content.includes('## critical')) {
-      return 'critical';
-    } else if (content.includes('priority: high') || content.includes('## high')) {
-      return 'high';
-    } else if (content.includes('priority: medium') || content.includes('## medium')) {
-      return 'medium';
-    } else if (content.includes('priority: low') || content.includes('## low')) {
-      return 'low';
-    }
-
-    return 'medium';
+  private extractPriority(content: string): PRPMetadata['priority'] {
+    return PRPKeywordUtils.findMarkedKeyword(content, PRPKeywordUtils.PRIORITY_MARKERS, PRPKeywordUtils.PRIORITIES) ?? 'medium';
   }
 
   /**
@@ -304,26 +300,38 @@ export class PRPParser {
   }
 
   /**
-   * Get context around a signal
+   * Get offsets of each line start in the content the lines were split from
+   */
+  private getLineOffsets(lines: string[]): number[] {
+    const offsets = new Array<number>(lines.length);
+    let offset = 0;
+    for (let i = 0; i < lines.length; i++) {
+      offsets[i] = offset;
+      offset += lines[i].length + 1;
+    }
+    return offsets;
+  }
+
+  /**
+   * Get context around a signal as a single slice of the original content
    */
-  private getContext(lines: string[], lineIndex: number, contextLines: number = 3): string {
+  private getContext(
+    content: string,
+    lines: string[],
+    lineOffsets: number[],
+    lineIndex: number,
+    contextLines: number = 3
+  ): string {
     const start = Math.max(0, lineIndex - contextLines);
-    const end = Math.min(lines.length, lineIndex + contextLines + 1);
-    return lines.slice(start, end).join('\n');
+    const last = Math.min(lines.length, lineIndex + contextLines + 1) - 1;
+    return content.substring(lineOffsets[start], lineOffsets[last] + lines[last].length);
   }
 
   /**
    * Determine signal priority based on type
    */
   private determineSignalPriority(signalType: string): DetectedSignal['priority'] {
-    const criticalSignals = ['AE', 'AA', 'OE', 'OA'];
-    const highSignals = ['Bb', 'OC', 'OD', 'AD'];
-    const mediumSignals = ['af', 'ap', 'op', 'oa'];
-
-    if (criticalSignals.includes(signalType)) return 'critical';
-    if (highSignals.includes(signalType)) return 'high';
-    if (mediumSignals.includes(signalType)) return 'medium';
-    return 'low';
+    return SIGNAL_PRIORITIES.get(signalType) || 'low';
   }
 
   /**
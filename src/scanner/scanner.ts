@@ -42,6 +42,9 @@ import { join, basename } from 'path';
 
 const logger = createLayerLogger('scanner');
 
+/** PRP files parsed at once, bounding open file handles on large worktrees */
+const PRP_PARSE_CONCURRENCY = 16;
+
 /**
  * ♫ Main Scanner - The conductor's eyes and ears
  */
@@ -548,29 +551,30 @@ export class Scanner extends EventEmitter {
     try {
       const status = await GitUtils.getRepoStatus(monitor.path);
 
-      // Process modified files
-      for (const file of status.modified) {
-        const fullPath = join(monitor.path, file);
-        const stats = await FileUtils.readFileStats(fullPath);
-
-        changes.push({
-          path: file,
-          type: 'modified',
-          size: stats.size,
-          timestamp: stats.modified
-        });
-      }
-
-      // Process added files
-      for (const file of status.added) {
-        const fullPath = join(monitor.path, file);
-        const stats = await FileUtils.readFileStats(fullPath);
+      // Process modified and added files, reading their stats concurrently.
+      // A file that cannot be read (e.g. removed since git status) only drops itself.
+      const statTargets = [
+        ...status.modified.map(file => ({ file, type: 'modified' as const })),
+        ...status.added.map(file => ({ file, type: 'added' as const }))
+      ];
+      const statResults = await Promise.allSettled(
+        statTargets.map(({ file }) => FileUtils.readFileStats(join(monitor.path, file)))
+      );
+
+      for (const [index, result] of statResults.entries()) {
+        const { file, type } = statTargets[index];
+        if (result.status === 'rejected') {
+          logger.warn('Scanner', `Failed to read stats for ${file} in ${worktree}`, {
+            error: result.reason instanceof Error ? result.reason.message : String(result.reason)
+          });
+          continue;
+        }
 
         changes.push({
           path: file,
-          type: 'added',
-          size: stats.size,
-          timestamp: stats.modified
+          type,
+          size: result.value.size,
+          timestamp: result.value.modified
         });
       }
 
@@ -614,13 +618,26 @@ export class Scanner extends EventEmitter {
       // Find all PRP files
       const prpFiles = await this.findPRPFiles(monitor.path);
 
-      for (const prpFile of prpFiles) {
-        const update = await this.parsePRPFile(worktree, prpFile, parser);
+      // Files are independent and parsePRPFile never rejects, so a fixed set of workers
+      // pull the next file as each read finishes, keeping a bounded number in flight
+      const results: unknown[] = new Array(prpFiles.length);
+      let nextIndex = 0;
+      const parseNext = async (): Promise<void> => {
+        while (nextIndex < prpFiles.length) {
+          const index = nextIndex++;
+          results[index] = await this.parsePRPFile(worktree, prpFiles[index], parser);
+        }
+      };
+      await Promise.all(Array.from({ length: Math.min(PRP_PARSE_CONCURRENCY, prpFiles.length) }, parseNext));
+
+      for (const update of results) {
         if (update) {
           updates.push(update as PRPScanResult);
         }
       }
 
+      this.trimParserCache(parser);
+
     } catch (error) {
       logger.warn('Scanner', `Failed to scan PRP files in ${worktree}`, { error: error instanceof Error ? error.message : String(error) });
     }
@@ -661,6 +678,21 @@ export class Scanner extends EventEmitter {
     return prpFiles;
   }
 
+  /**
+   * Once a parser's cache outgrows its limit, evict the oldest entries down to
+   * 80% of the limit so the next scans have headroom
+   */
+  private trimParserCache(parser: PRPParser): void {
+    if (parser.cache.size > parser.maxCacheSize) {
+      const entries = Array.from(parser.cache.entries());
+      entries.sort((a, b) => a[1].lastModified.getTime() - b[1].lastModified.getTime());
+      const excess = parser.cache.size - parser.maxCacheSize + Math.floor(parser.maxCacheSize * 0.2);
+      entries.slice(0, excess).forEach(([key]) => {
+        parser.cache.delete(key);
+      });
+    }
+  }
+
   /**
    * Parse a PRP file and extract signals
    */
@@ -685,15 +717,6 @@ export class Scanner extends EventEmitter {
         signals
       });
 
-      // Trim cache if needed
-      if (parser.cache.size > parser.maxCacheSize) {
-        const entries = Array.from(parser.cache.entries());
-        entries.sort((a, b) => a[1].lastModified.getTime() - b[1].lastModified.getTime());
-        entries.slice(0, Math.floor(parser.maxCacheSize * 0.2)).forEach(([key]) => {
-          parser.cache.delete(key);
-        });
-      }
-
       return {
         path: filePath,
         changeType: 'modified',
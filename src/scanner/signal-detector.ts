@@ -5,12 +5,67 @@
  * and custom signal support.
  */
 
+import { createHash } from 'crypto';
 import { Signal } from '../shared/types';
 import { SignalDetector, SignalPattern } from './types';
 import { createLayerLogger, HashUtils } from '../shared';
 
 const logger = createLayerLogger('scanner');
 
+/** Cache keys up to this length are stored verbatim instead of being hashed */
+const MAX_INLINE_CACHE_KEY_LENGTH = 512;
+
+/** Source of a plain case-insensitive `[xx]` pattern, as built by createPatternFromSignal */
+const LITERAL_SIGNAL_SOURCE = /^\\\[([A-Za-z0-9]{2})\\\]$/;
+
+/** Any `[xx]` signal token in content */
+const SIGNAL_TOKEN_PATTERN = /\[([A-Za-z0-9]{2})\]/g;
+
+/**
+ * Compiled matcher over the enabled patterns
+ */
+interface EnabledPatternMatcher {
+  literalPatterns: Map<string, SignalPattern>; // Lowercased code -> highest priority `[xx]` pattern
+  otherPatterns: SignalPattern[]; // Patterns that need their own regex pass
+  combined: RegExp | null; // Alternation of the other case-insensitive patterns
+  standalone: RegExp[]; // Other patterns with different flags, searched one by one
+}
+
+/** Per-scan state that can be shared across a batch of texts */
+interface ScanContext {
+  matcher: EnabledPatternMatcher;
+  detectedAt: Date;
+}
+
+/**
+ * Build a signal for a pattern match; all detected signals share this shape
+ */
+function createDetectedSignal(
+  pattern: SignalPattern,
+  match: string,
+  source: string,
+  agent: string,
+  timestamp: Date
+): Signal {
+  return {
+    id: HashUtils.generateSequentialId('signal'),
+    type: match.substring(1, 3), // Extract code from [Xx] format
+    priority: pattern.priority,
+    source,
+    timestamp,
+    data: {
+      rawSignal: match,
+      patternName: pattern.name,
+      category: pattern.category,
+      description: pattern.description
+    },
+    metadata: {
+      agent,
+      guideline: pattern.id
+    }
+  };
+}
+
 /**
  * ♫ Signal Detector Implementation
  */
@@ -20,9 +75,14 @@ export class SignalDetectorImpl implements SignalDetector {
   enabledCategories: Set<string>;
   cache: Map<string, Signal[]>;
   maxCacheSize: number;
+  private cacheHits = 0;
+  private cacheMisses = 0;
+  private enabledPatternMatcher: EnabledPatternMatcher | null = null;
+  private static defaultPatterns: readonly SignalPattern[] | null = null;
 
   constructor() {
-    this.patterns = this.getDefaultPatterns();
+    // Patterns are copied because their enabled flag is toggled per detector
+    this.patterns = SignalDetectorImpl.getDefaultPatterns().map(pattern => ({ ...pattern }));
     this.customPatterns = [];
     this.enabledCategories = new Set([
       'system', 'development', 'analysis', 'incident', 'coordination',
@@ -33,9 +93,19 @@ export class SignalDetectorImpl implements SignalDetector {
   }
 
   /**
-   * Get default signal patterns - All 75+ signals from AGENTS.md
+   * Get default signal patterns, built once and shared by all detectors
+   */
+  private static getDefaultPatterns(): readonly SignalPattern[] {
+    if (!SignalDetectorImpl.defaultPatterns) {
+      SignalDetectorImpl.defaultPatterns = SignalDetectorImpl.buildDefaultPatterns();
+    }
+    return SignalDetectorImpl.defaultPatterns;
+  }
+
+  /**
+   * Build default signal patterns - All 75+ signals from AGENTS.md
    */
-  private getDefaultPatterns(): SignalPattern[] {
+  private static buildDefaultPatterns(): SignalPattern[] {
     return [
       // === CRITICAL PRIORITY SIGNALS (9-10) ===
 
@@ -996,47 +1066,41 @@ export class SignalDetectorImpl implements SignalDetector {
    * Detect signals in text content
    */
   async detectSignals(content: string, source?: string): Promise<Signal[]> {
-    const hashString = await HashUtils.hashString(content);
-    const cacheKey = hashString.substring(0, 16);
+    return this.detectCachedSignals(content, source);
+  }
 
-    // Check cache first
-    if (this.cache.has(cacheKey)) {
-      return this.cache.get(cacheKey)!;
-    }
+  /**
+   * Detect signals in many texts at once, results in input order.
+   * The enabled pattern matcher and detection timestamp are resolved once for the whole batch.
+   */
+  async detectSignalsBatch(items: ReadonlyArray<{ content: string; source?: string }>): Promise<Signal[][]> {
+    const scan: ScanContext = { matcher: this.getEnabledPatternMatcher(), detectedAt: new Date() };
+    return items.map(({ content, source }) => this.detectCachedSignals(content, source, scan));
+  }
 
-    const signals: Signal[] = [];
-    const allPatterns = [...this.patterns, ...this.customPatterns];
+  /**
+   * Cached detection shared by detectSignals and detectSignalsBatch
+   */
+  private detectCachedSignals(content: string, source?: string, scan?: ScanContext): Signal[] {
+    // Empty content cannot hold a signal, so skip the cache entirely
+    if (content.length === 0) {
+      return [];
+    }
 
-    for (const pattern of allPatterns) {
-      if (!pattern.enabled || !this.enabledCategories.has(pattern.category)) {
-        continue;
-      }
+    const cacheKey = this.getCacheKey(content, source);
 
-      const matches = content.match(pattern.pattern);
-      if (matches) {
-        for (const match of matches) {
-          const signalCode = match.substring(1, 3); // Extract code from [Xx] format
-
-          signals.push({
-            id: HashUtils.generateId(),
-            type: signalCode,
-            priority: pattern.priority,
-            source: source || 'scanner',
-            timestamp: new Date(),
-            data: {
-              rawSignal: match,
-              patternName: pattern.name,
-              category: pattern.category,
-              description: pattern.description
-            },
-            metadata: {
-              agent: 'signal-detector',
-              guideline: pattern.id
-            }
-          });
-        }
-      }
+    // Check cache first, re-inserting the hit so trimming evicts least recently used entries
+    const cached = this.cache.get(cacheKey);
+    if (cached) {
+      this.cacheHits++;
+      this.cache.delete(cacheKey);
+      this.cache.set(cacheKey, cached);
+      return cached;
     }
+    this.cacheMisses++;
+
+    const { matcher, detectedAt } = scan ?? { matcher: this.getEnabledPatternMatcher(), detectedAt: new Date() };
+    const signals = Array.from(this.scanSignals(content, source || 'scanner', matcher, detectedAt));
 
     // Remove duplicates based on signal code
     const uniqueSignals = this.removeDuplicateSignals(signals);
@@ -1048,6 +1112,131 @@ export class SignalDetectorImpl implements SignalDetector {
     return uniqueSignals;
   }
 
+  /**
+   * Lazily yield signals found in content, without caching.
+   * Each literal signal code is yielded once; matches of other patterns are not deduplicated.
+   */
+  *iterateSignals(content: string, source?: string): Generator<Signal, void, undefined> {
+    // One timestamp for every signal found in this scan
+    yield* this.scanSignals(content, source || 'scanner', this.getEnabledPatternMatcher(), new Date());
+  }
+
+  /**
+   * Scan content with an already resolved matcher and timestamp
+   */
+  private *scanSignals(
+    content: string,
+    signalSource: string,
+    matcher: EnabledPatternMatcher,
+    detectedAt: Date
+  ): Generator<Signal, void, undefined> {
+    // A single pass over the [xx] tokens covers every literal pattern
+    const seenTypes = new Set<string>();
+    for (const token of content.matchAll(SIGNAL_TOKEN_PATTERN)) {
+      const signalCode = token[1];
+      if (seenTypes.has(signalCode)) {
+        continue;
+      }
+
+      const pattern = matcher.literalPatterns.get(signalCode.toLowerCase());
+      if (pattern) {
+        seenTypes.add(signalCode);
+        yield createDetectedSignal(pattern, token[0], signalSource, 'signal-detector', detectedAt);
+      }
+    }
+
+    // Remaining patterns are arbitrary regexes and get their own pass
+    for (const pattern of matcher.otherPatterns) {
+      if (pattern.pattern.global) {
+        for (const match of content.matchAll(pattern.pattern)) {
+          yield createDetectedSignal(pattern, match[0], signalSource, 'signal-detector', detectedAt);
+        }
+      } else {
+        for (const match of content.match(pattern.pattern) || []) {
+          yield createDetectedSignal(pattern, match, signalSource, 'signal-detector', detectedAt);
+        }
+      }
+    }
+  }
+
+  /**
+   * Check whether content contains any enabled signal, stopping at the first match.
+   * Call detectSignals directly when the signals are needed, otherwise the content is scanned twice.
+   */
+  hasSignals(content: string): boolean {
+    const matcher = this.getEnabledPatternMatcher();
+
+    // Tokens are produced lazily, so the scan stops at the first enabled literal signal
+    if (matcher.literalPatterns.size > 0) {
+      for (const token of content.matchAll(SIGNAL_TOKEN_PATTERN)) {
+        if (matcher.literalPatterns.has(token[1].toLowerCase())) {
+          return true;
+        }
+      }
+    }
+
+    if (matcher.combined && content.search(matcher.combined) >= 0) {
+      return true;
+    }
+    return matcher.standalone.some(pattern => content.search(pattern) >= 0);
+  }
+
+  /**
+   * Get the compiled matcher for enabled patterns, building it on first use
+   */
+  private getEnabledPatternMatcher(): EnabledPatternMatcher {
+    if (this.enabledPatternMatcher) {
+      return this.enabledPatternMatcher;
+    }
+
+    const literalPatterns = new Map<string, SignalPattern>();
+    const otherPatterns: SignalPattern[] = [];
+    const sources: string[] = [];
+    const standalone: RegExp[] = [];
+    for (const pattern of this.getEnabledPatterns()) {
+      const caseInsensitive = pattern.pattern.flags.replace('g', '') === 'i';
+
+      // Keep the first highest priority pattern per code, as removeDuplicateSignals would
+      const literal = caseInsensitive ? LITERAL_SIGNAL_SOURCE.exec(pattern.pattern.source) : null;
+      if (literal) {
+        const code = literal[1].toLowerCase();
+        const existing = literalPatterns.get(code);
+        if (!existing || existing.priority < pattern.priority) {
+          literalPatterns.set(code, pattern);
+        }
+        continue;
+      }
+
+      otherPatterns.push(pattern);
+      if (caseInsensitive) {
+        sources.push(`(?:${pattern.pattern.source})`);
+      } else {
+        standalone.push(pattern.pattern);
+      }
+    }
+
+    this.enabledPatternMatcher = {
+      literalPatterns,
+      otherPatterns,
+      combined: sources.length > 0 ? new RegExp(sources.join('|'), 'i') : null,
+      standalone
+    };
+    return this.enabledPatternMatcher;
+  }
+
+  /**
+   * Build the detection cache key for content and source
+   */
+  private getCacheKey(content: string, source?: string): string {
+    // Length-prefix the source so a ':' inside it cannot shift the source/content boundary
+    const sourceKey = source || 'scanner';
+    const key = `${sourceKey.length}:${sourceKey}:${content}`;
+    if (key.length <= MAX_INLINE_CACHE_KEY_LENGTH) {
+      return key;
+    }
+    return createHash('sha256').update(key).digest('hex').substring(0, 16);
+  }
+
   /**
    * Remove duplicate signals based on type and priority
    */
@@ -1086,6 +1275,7 @@ export class SignalDetectorImpl implements SignalDetector {
     };
 
     this.customPatterns.push(customPattern);
+    this.enabledPatternMatcher = null;
 
     logger.info('SignalDetector', `Added custom pattern: ${customPattern.name}`, { patternId: customPattern.id, category: customPattern.category });
 
@@ -1099,6 +1289,7 @@ export class SignalDetectorImpl implements SignalDetector {
     const index = this.customPatterns.findIndex(p => p.id === patternId);
     if (index >= 0) {
       const removed = this.customPatterns.splice(index, 1)[0];
+      this.enabledPatternMatcher = null;
       logger.info('SignalDetector', `Removed custom pattern: ${removed?.name || 'unknown'}`, { patternId });
       return true;
     }
@@ -1114,6 +1305,7 @@ export class SignalDetectorImpl implements SignalDetector {
     } else {
       this.enabledCategories.delete(category);
     }
+    this.enabledPatternMatcher = null;
 
     logger.info('SignalDetector', `${enabled ? 'Enabled' : 'Disabled'} category: ${category}`);
   }
@@ -1122,12 +1314,13 @@ export class SignalDetectorImpl implements SignalDetector {
    * Enable/disable a specific pattern
    */
   setPatternEnabled(patternId: string, enabled: boolean): void {
-    const allPatterns = [...this.patterns, ...this.customPatterns];
-    const pattern = allPatterns.find(p => p.id === patternId);
-
-    if (pattern) {
-      pattern.enabled = enabled;
-      logger.info('SignalDetector', `${enabled ? 'Enabled' : 'Disabled'} pattern: ${pattern.name}`, { patternId });
+    for (const pattern of this.iteratePatterns()) {
+      if (pattern.id === patternId) {
+        pattern.enabled = enabled;
+        this.enabledPatternMatcher = null;
+        logger.info('SignalDetector', `${enabled ? 'Enabled' : 'Disabled'} pattern: ${pattern.name}`, { patternId });
+        return;
+      }
     }
   }
 
@@ -1138,27 +1331,48 @@ export class SignalDetectorImpl implements SignalDetector {
     return [...this.patterns, ...this.customPatterns];
   }
 
+  /**
+   * Walk default then custom patterns without building a combined array
+   */
+  private *iteratePatterns(): Generator<SignalPattern> {
+    yield* this.patterns;
+    yield* this.customPatterns;
+  }
+
   /**
    * Get patterns by category
    */
   getPatternsByCategory(category: string): SignalPattern[] {
-    return this.getAllPatterns().filter(p => p.category === category);
+    const patterns: SignalPattern[] = [];
+    for (const pattern of this.iteratePatterns()) {
+      if (pattern.category === category) {
+        patterns.push(pattern);
+      }
+    }
+    return patterns;
   }
 
   /**
    * Get enabled patterns
    */
   getEnabledPatterns(): SignalPattern[] {
-    return this.getAllPatterns().filter(p =>
-      p.enabled && this.enabledCategories.has(p.category)
-    );
+    const patterns: SignalPattern[] = [];
+    for (const pattern of this.iteratePatterns()) {
+      if (pattern.enabled && this.enabledCategories.has(pattern.category)) {
+        patterns.push(pattern);
+      }
+    }
+    return patterns;
   }
 
   /**
    * Get available categories
    */
   getCategories(): string[] {
-    const categories = new Set(this.getAllPatterns().map(p => p.category));
+    const categories = new Set<string>();
+    for (const pattern of this.iteratePatterns()) {
+      categories.add(pattern.category);
+    }
     return Array.from(categories);
   }
 
@@ -1167,6 +1381,8 @@ export class SignalDetectorImpl implements SignalDetector {
    */
   clearCache(): void {
     this.cache.clear();
+    this.cacheHits = 0;
+    this.cacheMisses = 0;
     logger.info('SignalDetector', 'Signal detection cache cleared');
   }
 
@@ -1176,12 +1392,13 @@ export class SignalDetectorImpl implements SignalDetector {
   getCacheStats(): {
     size: number;
     maxSize: number;
-    hitRate: number; // Would need to implement hit tracking
+    hitRate: number;
   } {
+    const lookups = this.cacheHits + this.cacheMisses;
     return {
       size: this.cache.size,
       maxSize: this.maxCacheSize,
-      hitRate: 0 // Placeholder - would need hit tracking implementation
+      hitRate: lookups > 0 ? this.cacheHits / lookups : 0
     };
   }
 
@@ -1255,28 +1472,8 @@ export class SignalDetectorImpl implements SignalDetector {
     signals: Signal[];
   } {
     const matches = sampleText.match(pattern.pattern) || [];
-    const signals: Signal[] = [];
-
-    for (const match of matches) {
-      const signalCode = match.substring(1, 3);
-      signals.push({
-        id: HashUtils.generateId(),
-        type: signalCode,
-        priority: pattern.priority,
-        source: 'test',
-        timestamp: new Date(),
-        data: {
-          rawSignal: match,
-          patternName: pattern.name,
-          category: pattern.category,
-          description: pattern.description
-        },
-        metadata: {
-          agent: 'signal-detector-test',
-          guideline: pattern.id
-        }
-      });
-    }
+    const testedAt = new Date();
+    const signals = matches.map(match => createDetectedSignal(pattern, match, 'test', 'signal-detector-test', testedAt));
 
     return {
       matches,
@@ -616,7 +616,8 @@ export class TokenAccountingManager {
       };
 
       await FileUtils.ensureDir((await import('path')).dirname(this.persistPath));
-      await FileUtils.writeTextFile(this.persistPath, JSON.stringify(data, null, 2));
+      // Machine-read snapshot that grows with every entry, so skip pretty-printing
+      await FileUtils.writeTextFile(this.persistPath, JSON.stringify(data));
     } catch (error) {
       const err = error instanceof Error ? error : new Error(String(error));
       logger.error('TokenAccounting', 'Failed to persist token accounting data', err, {
@@ -637,10 +638,10 @@ export class TokenAccountingManager {
       if (!data) return;
 
       // Load entries (only recent ones to avoid memory issues)
-      const cutoffDate = TimeUtils.daysAgo(30); // Keep only last 30 days
+      const cutoffTime = TimeUtils.daysAgo(30).getTime(); // Keep only last 30 days
       if (data.entries) {
         data.entries.forEach((entry: TokenAccountingEntry) => {
-          if (new Date(entry.timestamp) > cutoffDate) {
+          if (TimeUtils.toTimestamp(entry.timestamp) > cutoffTime) {
             this.entries.set(entry.id, entry);
           }
         });
@@ -649,7 +650,7 @@ export class TokenAccountingManager {
       // Load alerts (only unresolved recent ones)
       if (data.alerts) {
         data.alerts.forEach((alert: TokenAlert) => {
-          if (!alert.resolved && new Date(alert.timestamp) > cutoffDate) {
+          if (!alert.resolved && TimeUtils.toTimestamp(alert.timestamp) > cutoffTime) {
             this.alerts.set(alert.id, alert);
           }
         });
@@ -668,18 +669,18 @@ export class TokenAccountingManager {
    * Cleanup old data
    */
   async cleanup(): Promise<void> {
-    const cutoffDate = TimeUtils.daysAgo(30);
+    const cutoffTime = TimeUtils.daysAgo(30).getTime();
 
     // Remove old entries
     Array.from(this.entries.entries()).forEach(([id, entry]) => {
-      if (new Date(entry.timestamp) < cutoffDate) {
+      if (TimeUtils.toTimestamp(entry.timestamp) < cutoffTime) {
         this.entries.delete(id);
       }
     });
 
     // Remove old resolved alerts
     Array.from(this.alerts.entries()).forEach(([id, alert]) => {
-      if (alert.resolved && alert.resolvedAt && new Date(alert.resolvedAt) < cutoffDate) {
+      if (alert.resolved && alert.resolvedAt && TimeUtils.toTimestamp(alert.resolvedAt) < cutoffTime) {
         this.alerts.delete(id);
       }
     });
@@ -26,6 +26,7 @@ export {
 export {
   TokenCounter,
   SignalParser,
+  PRPKeywordUtils,
   FileUtils,
   GitUtils,
   PerformanceMonitor,
@@ -194,6 +194,14 @@ export class Logger {
     });
   }
 
+  /**
+   * Check whether entries at the given level would be written, so callers
+   * can skip building expensive messages or metadata
+   */
+  isLevelEnabled(level: LogLevel): boolean {
+    return this.shouldLog(level);
+  }
+
   // Logging methods
   debug(
     layer: LogEntry['layer'],
@@ -405,6 +413,8 @@ export const logger = new Logger();
 
 // Layer-specific convenience methods
 export const createLayerLogger = (layer: LogEntry['layer']) => ({
+  isDebugEnabled: () => logger.isLevelEnabled(LogLevel.DEBUG),
+
   debug: (component: string, message: string, metadata?: Record<string, unknown>) =>
     logger.debug(layer, component, message, metadata),
 
@@ -87,6 +87,31 @@ export class SignalParser {
   }
 }
 
+/**
+ * PRP keyword utilities shared by the PRP parsers
+ */
+export class PRPKeywordUtils {
+  /** Priority keywords in precedence order, as marked by `priority: x` or a `## x` heading */
+  static readonly PRIORITIES: ReadonlyArray<'critical' | 'high' | 'medium' | 'low'> = ['critical', 'high', 'medium', 'low'];
+  static readonly PRIORITY_MARKERS = /(?:priority: |## )(critical|high|medium|low)/g;
+
+  /**
+   * Scan content once with a keyword alternation and return the highest-precedence
+   * keyword that appeared anywhere, regardless of position
+   */
+  static findMarkedKeyword<T extends string>(
+    content: string,
+    markers: RegExp,
+    precedence: ReadonlyArray<T>
+  ): T | undefined {
+    const found = new Set<string>();
+    for (const [, keyword] of content.matchAll(markers)) {
+      found.add(keyword);
+    }
+    return precedence.find(keyword => found.has(keyword));
+  }
+}
+
 /**
  * File system utilities
  */
@@ -162,13 +187,17 @@ export class GitUtils {
     const execAsync = promisify(exec);
 
     try {
-      const { stdout } = await execAsync('git status --porcelain', {
-        cwd: repoPath,
-      });
+      // Status and branch come from separate git processes, so run them together
+      const [{ stdout }, branch] = await Promise.all([
+        execAsync('git status --porcelain', {
+          cwd: repoPath,
+        }),
+        this.getCurrentBranch(repoPath)
+      ]);
 
       const lines = stdout.trim().split('\n');
       const result = {
-        branch: await this.getCurrentBranch(repoPath),
+        branch,
         modified: [] as string[],
         added: [] as string[],
         deleted: [] as string[],
@@ -409,12 +438,22 @@ export class TimeUtils {
   static isWithinTimeRange(date: Date, start: Date, end: Date): boolean {
     return date >= start && date <= end;
   }
+
+  static toTimestamp(value: Date | string | number): number {
+    if (value instanceof Date) {
+      return value.getTime();
+    }
+    return typeof value === 'number' ? value : Date.parse(value);
+  }
 }
 
 /**
  * Hash utilities
  */
 export class HashUtils {
+  private static readonly sequenceEpoch = Date.now().toString(36);
+  private static sequence = 0;
+
   static async hashString(str: string): Promise<string> {
     const crypto = await import('crypto');
     return crypto.createHash('sha256').update(str).digest('hex');
@@ -431,6 +470,10 @@ export class HashUtils {
     return `${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
   }
 
+  static generateSequentialId(prefix: string): string {
+    return `${prefix}_${HashUtils.sequenceEpoch}_${(++HashUtils.sequence).toString(36)}`;
+  }
+
   static generateShortId(): string {
     return Math.random().toString(36).substr(2, 8);
   }
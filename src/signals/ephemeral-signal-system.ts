@@ -5,10 +5,40 @@
  */
 
 import { EventEmitter } from 'events';
+import { LRUCache } from 'lru-cache';
 import { HashUtils, createLayerLogger } from '../shared';
 
 const logger = createLayerLogger('orchestrator');
 
+/** Number of most recent signals kept in history */
+const MAX_SIGNAL_HISTORY = 1000;
+
+/** Number of processed signals summarized in one log entry */
+const SIGNAL_LOG_BATCH_SIZE = 64;
+
+/** Longest a processed signal waits before a partial batch is logged */
+const SIGNAL_LOG_FLUSH_INTERVAL_MS = 1000;
+
+/** Signals that are logged as soon as they are processed */
+const URGENT_SIGNAL_TYPES: ReadonlySet<string> = new Set(['[AE]', '[AA]']);
+
+/** Cycles that are never ended are evicted oldest-first beyond this count */
+const MAX_ACTIVE_CYCLES = 256;
+
+/** Static defaults for agents first reported through updateAgentStatus */
+const AGENT_STATUS_DEFAULTS: Readonly<Pick<AgentStatus, 'type' | 'status'>> = Object.freeze({
+  type: 'unknown',
+  status: 'idle'
+});
+
+/** Static defaults for PRPs first reported through updatePRPStatus */
+const PRP_STATUS_DEFAULTS: Readonly<Pick<PRPStatus, 'branch' | 'status' | 'progress' | 'doDMet'>> = Object.freeze({
+  branch: 'main',
+  status: 'planning',
+  progress: 0,
+  doDMet: false
+});
+
 export interface EphemeralSignal {
   id: string;
   type: string; // Always [XX] format
@@ -85,7 +115,10 @@ export interface MemoryStatus {
 export class EphemeralSignalSystem extends EventEmitter {
   private currentStatus: SystemStatus;
   private signalHistory: EphemeralSignal[] = [];
-  private activeCycles: Map<string, CycleState> = new Map();
+  private activeCycles: LRUCache<string, CycleState> = new LRUCache({ max: MAX_ACTIVE_CYCLES });
+  private unloggedSignalCounts: Map<string, number> = new Map();
+  private unloggedSignalTotal = 0;
+  private signalLogTimer?: ReturnType<typeof setTimeout>;
 
   constructor() {
     super();
@@ -123,13 +156,26 @@ export class EphemeralSignalSystem extends EventEmitter {
       ephemeral: true
     };
 
-    this.signalHistory.push(signal);
-    logger.debug('EphemeralSignalSystem',
-      `Generated [HF] signal with ${this.currentStatus.activePRPs.length} active PRPs`);
+    this.recordSignal(signal);
+    if (logger.isDebugEnabled()) {
+      logger.debug('EphemeralSignalSystem',
+        `Generated [HF] signal with ${this.currentStatus.activePRPs.length} active PRPs`);
+    }
 
     return signal;
   }
 
+  /**
+   * Append a signal to history, trimming in batches so appends stay amortized O(1)
+   */
+  private recordSignal(signal: EphemeralSignal): void {
+    this.signalHistory.push(signal);
+
+    if (this.signalHistory.length >= MAX_SIGNAL_HISTORY * 2) {
+      this.signalHistory.splice(0, this.signalHistory.length - MAX_SIGNAL_HISTORY);
+    }
+  }
+
   /**
    * Get current cycle context
    */
@@ -194,7 +240,8 @@ export class EphemeralSignalSystem extends EventEmitter {
    */
   private getTimeInCurrentCycle(): number {
     // This would track how long we've been in the current orchestration cycle
-    return Date.now() - (this.activeCycles.get('main')?.startTime || Date.now());
+    const cycle = this.activeCycles.peek('main');
+    return cycle ? performance.now() - cycle.startedAt : 0;
   }
 
   /**
@@ -207,16 +254,17 @@ export class EphemeralSignalSystem extends EventEmitter {
       Object.assign(existingAgent, status);
     } else {
       this.currentStatus.activeAgents.push({
+        ...AGENT_STATUS_DEFAULTS,
         id: agentId,
-        type: status.type || 'unknown',
-        status: status.status || 'idle',
         lastActivity: new Date(),
         ...status
       });
     }
 
-    logger.debug('EphemeralSignalSystem',
-      `Agent ${agentId} status updated to ${status.status}`);
+    if (logger.isDebugEnabled()) {
+      logger.debug('EphemeralSignalSystem',
+        `Agent ${agentId} status updated to ${status.status}`);
+    }
   }
 
   /**
@@ -229,20 +277,19 @@ export class EphemeralSignalSystem extends EventEmitter {
       Object.assign(existingPRP, status);
     } else {
       this.currentStatus.activePRPs.push({
+        ...PRP_STATUS_DEFAULTS,
         id: prpId,
-        name: status.name || prpId,
-        branch: status.branch || 'main',
-        status: status.status || 'planning',
-        progress: 0,
+        name: prpId,
         lastUpdate: new Date(),
-        doDMet: false,
         blockers: [],
         ...status
       });
     }
 
-    logger.debug('EphemeralSignalSystem',
-      `PRP ${prpId} status updated to ${status.status}`);
+    if (logger.isDebugEnabled()) {
+      logger.debug('EphemeralSignalSystem',
+        `PRP ${prpId} status updated to ${status.status}`);
+    }
   }
 
   /**
@@ -261,8 +308,10 @@ export class EphemeralSignalSystem extends EventEmitter {
   updateResourceStatus(type: 'tokens' | 'disk' | 'memory', status: Partial<TokenStatus | DiskStatus | MemoryStatus>): void {
     Object.assign(this.currentStatus.resourceStatus[type], status);
 
-    logger.debug('EphemeralSignalSystem',
-      `Resource ${type} status updated`);
+    if (logger.isDebugEnabled()) {
+      logger.debug('EphemeralSignalSystem',
+        `Resource ${type} status updated`);
+    }
   }
 
   /**
@@ -275,8 +324,34 @@ export class EphemeralSignalSystem extends EventEmitter {
     // Emit for orchestrator processing
     this.emit('signal_received', signal);
 
+    // Log processed signals in batches rather than one entry per signal
+    this.unloggedSignalCounts.set(signal.type, (this.unloggedSignalCounts.get(signal.type) || 0) + 1);
+    if (++this.unloggedSignalTotal >= SIGNAL_LOG_BATCH_SIZE || URGENT_SIGNAL_TYPES.has(signal.type)) {
+      this.flushSignalLog();
+    } else if (!this.signalLogTimer) {
+      // Partial batches are logged on a timer that never keeps the process alive
+      this.signalLogTimer = setTimeout(() => this.flushSignalLog(), SIGNAL_LOG_FLUSH_INTERVAL_MS);
+      this.signalLogTimer.unref();
+    }
+  }
+
+  /**
+   * Log a summary of signals processed since the last flush
+   */
+  flushSignalLog(): void {
+    if (this.signalLogTimer) {
+      clearTimeout(this.signalLogTimer);
+      this.signalLogTimer = undefined;
+    }
+    if (this.unloggedSignalTotal === 0) return;
+
     logger.info('EphemeralSignalSystem',
-      `Processed signal ${signal.type} from ${signal.source}`);
+      `Processed ${this.unloggedSignalTotal} signals`, {
+        byType: Object.fromEntries(this.unloggedSignalCounts)
+      });
+
+    this.unloggedSignalCounts.clear();
+    this.unloggedSignalTotal = 0;
   }
 
   /**
@@ -321,8 +396,9 @@ export class EphemeralSignalSystem extends EventEmitter {
    * Get signal history
    */
   getSignalHistory(limit?: number): EphemeralSignal[] {
-    const history = [...this.signalHistory].sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime());
-    return limit ? history.slice(0, limit) : history;
+    // History is appended in generation order, so newest first is a reversed tail
+    const count = limit ? Math.min(limit, MAX_SIGNAL_HISTORY) : MAX_SIGNAL_HISTORY;
+    return this.signalHistory.slice(-count).reverse();
   }
 
   /**
@@ -332,8 +408,10 @@ export class EphemeralSignalSystem extends EventEmitter {
     const cutoff = new Date(Date.now() - maxAge);
     this.signalHistory = this.signalHistory.filter(signal => signal.timestamp > cutoff);
 
-    logger.debug('EphemeralSignalSystem',
-      `Cleaned up signals older than ${maxAge}ms`);
+    if (logger.isDebugEnabled()) {
+      logger.debug('EphemeralSignalSystem',
+        `Cleaned up signals older than ${maxAge}ms`);
+    }
   }
 
   /**
@@ -343,6 +421,7 @@ export class EphemeralSignalSystem extends EventEmitter {
     this.activeCycles.set(cycleId, {
       id: cycleId,
       startTime: Date.now(),
+      startedAt: performance.now(),
       signalsProcessed: 0,
       tasksCompleted: 0
     });
@@ -356,9 +435,10 @@ export class EphemeralSignalSystem extends EventEmitter {
    */
   endCycle(cycleId: string = 'main'): CycleState | undefined {
     const cycle = this.activeCycles.get(cycleId);
+    this.flushSignalLog();
     if (cycle) {
       cycle.endTime = Date.now();
-      cycle.duration = cycle.endTime - cycle.startTime;
+      cycle.duration = Math.round(performance.now() - cycle.startedAt);
 
       this.activeCycles.delete(cycleId);
 
@@ -373,13 +453,14 @@ export class EphemeralSignalSystem extends EventEmitter {
    * Get cycle statistics
    */
   getCycleStats(): Map<string, CycleState> {
-    return new Map(this.activeCycles);
+    return new Map(this.activeCycles.entries());
   }
 }
 
 export interface CycleState {
   id: string;
-  startTime: number;
+  startTime: number; // Wall-clock start, for display
+  startedAt: number; // Monotonic start from performance.now(), for durations
   endTime?: number;
   duration?: number;
   signalsProcessed: number;
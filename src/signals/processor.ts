@@ -38,6 +38,15 @@ export class SignalProcessor {
   private signalRegistry: SignalRegistry;
   private pendingSignals: Map<string, Signal> = new Map();
   private signalHistory: SignalProcessingResult[] = [];
+  // Running metrics, updated as results are recorded so getMetrics never rescans history
+  private metricCounts = {
+    byCategory: {} as Record<string, number>,
+    byHandler: {} as Record<string, number>,
+    byPriority: {} as Record<string, number>,
+    escalated: 0,
+    resolved: 0,
+    totalResolutionTime: 0
+  };
   
   constructor(eventBus: EventBus, logger: Logger) {
     this.eventBus = eventBus;
@@ -73,6 +82,7 @@ export class SignalProcessor {
 
       // Record processing result
       this.signalHistory.push(result);
+      this.updateMetrics(result, definition);
 
       // Remove from pending if successfully processed
       if (result.processed) {
@@ -176,36 +186,16 @@ export class SignalProcessor {
    * Get processing metrics
    */
   getMetrics(): SignalMetrics {
-    const byCategory: Record<string, number> = {};
-    const byHandler: Record<string, number> = {};
-    const byPriority: Record<string, number> = {};
-
-    // Count signals by various dimensions
-    for (const result of this.signalHistory) {
-      const definition = this.signalRegistry.getDefinition(result.signal.type.replace(/[[\]]/g, ''));
-      if (definition) {
-        byCategory[definition.category] = (byCategory[definition.category] || 0) + 1;
-        byHandler[definition.handler] = (byHandler[definition.handler] || 0) + 1;
-      }
-      byPriority[result.signal.priority] = (byPriority[result.signal.priority] || 0) + 1;
-    }
-
-    // Calculate escalation rate
-    const escalatedSignals = this.signalHistory.filter(r => r.escalation).length;
-    const escalationRate = this.signalHistory.length > 0 ? escalatedSignals / this.signalHistory.length : 0;
-
-    // Calculate average resolution time
-    const resolvedSignals = this.signalHistory.filter(r => r.processed);
-    const averageResolutionTime = resolvedSignals.length > 0 ?
-      resolvedSignals.reduce((sum, r) => sum + (r.timestamp.getTime() - r.signal.timestamp.getTime()), 0) / resolvedSignals.length : 0;
+    const counts = this.metricCounts;
+    const totalSignals = this.signalHistory.length;
 
     return {
-      totalSignals: this.signalHistory.length,
-      byCategory,
-      byHandler,
-      byPriority,
-      escalationRate,
-      averageResolutionTime,
+      totalSignals,
+      byCategory: { ...counts.byCategory },
+      byHandler: { ...counts.byHandler },
+      byPriority: { ...counts.byPriority },
+      escalationRate: totalSignals > 0 ? counts.escalated / totalSignals : 0,
+      averageResolutionTime: counts.resolved > 0 ? counts.totalResolutionTime / counts.resolved : 0,
       pendingSignals: this.pendingSignals.size
     };
   }
@@ -303,6 +293,23 @@ export class SignalProcessor {
     }
   }
 
+  private updateMetrics(result: SignalProcessingResult, definition: SignalDefinition): void {
+    const counts = this.metricCounts;
+    const priority = result.signal.priority;
+
+    counts.byCategory[definition.category] = (counts.byCategory[definition.category] || 0) + 1;
+    counts.byHandler[definition.handler] = (counts.byHandler[definition.handler] || 0) + 1;
+    counts.byPriority[priority] = (counts.byPriority[priority] || 0) + 1;
+
+    if (result.escalation) {
+      counts.escalated++;
+    }
+    if (result.processed) {
+      counts.resolved++;
+      counts.totalResolutionTime += result.timestamp.getTime() - result.signal.timestamp.getTime();
+    }
+  }
+
   private createResult(signal: Signal, processed: boolean, handler: string, action: string, escalation?: string): SignalProcessingResult {
     return {
       signal,
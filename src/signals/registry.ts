@@ -445,6 +445,10 @@ export const SIGNAL_REGISTRY: Record<string, SignalDefinition> = {
   }
 };
 
+/** Registry tags and definitions captured once at load, since the registry is static */
+const SIGNAL_TAGS: readonly string[] = Object.keys(SIGNAL_REGISTRY);
+const SIGNAL_DEFINITIONS: readonly SignalDefinition[] = Object.values(SIGNAL_REGISTRY);
+
 /**
  * Signal Registry Manager
  */
@@ -470,14 +474,14 @@ export class SignalRegistry {
    * Get all signals by category
    */
   getByCategory(category: SignalDefinition['category']): SignalDefinition[] {
-    return Object.values(SIGNAL_REGISTRY).filter(signal => signal.category === category);
+    return SIGNAL_DEFINITIONS.filter(signal => signal.category === category);
   }
 
   /**
    * Get all signals by handler
    */
   getByHandler(handler: 'orchestrator' | 'admin'): SignalDefinition[] {
-    return Object.values(SIGNAL_REGISTRY).filter(signal => signal.handler === handler);
+    return SIGNAL_DEFINITIONS.filter(signal => signal.handler === handler);
   }
 
   /**
@@ -551,14 +555,14 @@ export class SignalRegistry {
    * Get all registered signal tags
    */
   getAllTags(): string[] {
-    return Object.keys(SIGNAL_REGISTRY);
+    return [...SIGNAL_TAGS];
   }
 
   /**
    * Get signals by priority range
    */
   getByPriorityRange(minPriority: number, maxPriority: number): SignalDefinition[] {
-    return Object.values(SIGNAL_REGISTRY).filter(
+    return SIGNAL_DEFINITIONS.filter(
       signal => signal.priority >= minPriority && signal.priority <= maxPriority
     );
   }
@@ -748,12 +748,13 @@ export class StorageManager {
    */
   private async performCleanup(): Promise<void> {
     const cutoffDate = TimeUtils.daysAgo(this.config.retentionPeriod);
+    const cutoffTime = cutoffDate.getTime();
 
     try {
       // Clean old signals
       let signalsCleaned = 0;
       for (const [id, signal] of Object.entries(this.state.signals)) {
-        if (new Date(signal.timestamp) < cutoffDate && signal.metadata.resolved) {
+        if (TimeUtils.toTimestamp(signal.timestamp) < cutoffTime && signal.metadata.resolved) {
           delete this.state.signals[id];
           signalsCleaned++;
         }
@@ -762,14 +763,14 @@ export class StorageManager {
       // Clean old time series data
       const originalLength = this.state.tokens.accounting.byTime.length;
       this.state.tokens.accounting.byTime = this.state.tokens.accounting.byTime.filter(
-        entry => new Date(entry.timestamp) > cutoffDate
+        entry => TimeUtils.toTimestamp(entry.timestamp) > cutoffTime
       );
       const timeSeriesCleaned = originalLength - this.state.tokens.accounting.byTime.length;
 
       // Clean old error entries
       const originalErrors = this.state.metrics.errors.recent.length;
       this.state.metrics.errors.recent = this.state.metrics.errors.recent.filter(
-        error => new Date(error.timestamp) > cutoffDate
+        error => TimeUtils.toTimestamp(error.timestamp) > cutoffTime
       );
       const errorsCleaned = originalErrors - this.state.metrics.errors.recent.length;
 
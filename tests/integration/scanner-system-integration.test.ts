@@ -41,6 +41,7 @@ const mockExistsSync = require('fs').existsSync as jest.MockedFunction<typeof re
 
 // Mock shared utilities
 jest.mock('../../src/shared/utils', () => ({
+  PRPKeywordUtils: jest.requireActual('../../src/shared/utils').PRPKeywordUtils,
   createLayerLogger: jest.fn(() => ({
     debug: jest.fn(),
     info: jest.fn(),
@@ -50,12 +51,14 @@ jest.mock('../../src/shared/utils', () => ({
   })),
   HashUtils: {
     generateId: jest.fn(() => 'test-id'),
+    generateSequentialId: jest.fn(() => 'test-id'),
     hashString: jest.fn((str: string) => `hash-${str}`),
     hashFile: jest.fn(() => Promise.resolve('file-hash'))
   },
   TimeUtils: {
     now: jest.fn(() => new Date('2024-01-01T00:00:00Z')),
-    daysAgo: jest.fn((days: number) => new Date(Date.now() - days * 24 * 60 * 60 * 1000))
+    daysAgo: jest.fn((days: number) => new Date(Date.now() - days * 24 * 60 * 60 * 1000)),
+    toTimestamp: jest.fn((value: Date | string | number) => new Date(value).getTime())
   },
   FileUtils: {
     readTextFile: jest.fn(),
@@ -23,11 +23,13 @@ jest.mock('../../src/shared/utils', () => ({
   HashUtils: {
     hashString: jest.fn((str: string) => `hash-${str}`),
     hashFile: jest.fn(() => Promise.resolve('file-hash')),
-    generateId: jest.fn(() => 'test-id')
+    generateId: jest.fn(() => 'test-id'),
+    generateSequentialId: jest.fn(() => 'test-id')
   },
   TimeUtils: {
     now: jest.fn(() => new Date('2024-01-01T00:00:00Z')),
-    daysAgo: jest.fn((days: number) => new Date(Date.now() - days * 24 * 60 * 60 * 1000))
+    daysAgo: jest.fn((days: number) => new Date(Date.now() - days * 24 * 60 * 60 * 1000)),
+    toTimestamp: jest.fn((value: Date | string | number) => new Date(value).getTime())
   },
   FileUtils: {
     readTextFile: jest.fn(() => Promise.resolve('test content')),
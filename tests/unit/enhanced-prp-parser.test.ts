@@ -19,6 +19,7 @@ const mockStat = require('fs/promises').stat as jest.MockedFunction<typeof requi
 
 // Mock shared utilities
 jest.mock('../../src/shared/utils', () => ({
+  PRPKeywordUtils: jest.requireActual('../../src/shared/utils').PRPKeywordUtils,
   createLayerLogger: jest.fn(() => ({
     debug: jest.fn(),
     info: jest.fn(),
@@ -28,7 +29,8 @@ jest.mock('../../src/shared/utils', () => ({
   HashUtils: {
     hashString: jest.fn((str: string) => `hash-${str}`),
     hashFile: jest.fn(() => Promise.resolve('file-hash')),
-    generateId: jest.fn(() => 'test-id')
+    generateId: jest.fn(() => 'test-id'),
+    generateSequentialId: jest.fn(() => 'test-id')
   },
   FileUtils: {
     readTextFile: jest.fn(),
@@ -470,6 +472,14 @@ Blockers: API credentials needed
       expect(prpFile?.metadata.priority).toBe('critical');
     });
 
+    test('should prefer the highest-precedence marker regardless of position', async () => {
+      mockReadFile.mockResolvedValueOnce('# Test PRP\n## blocked\nstatus: review\npriority: low\n## high');
+      const prpFile = await parser.parsePRPFile('/test/PRP-test.md');
+
+      expect(prpFile?.metadata.status).toBe('review');
+      expect(prpFile?.metadata.priority).toBe('high');
+    });
+
     test('should extract requirements', async () => {
       const content = `
         # Test PRP
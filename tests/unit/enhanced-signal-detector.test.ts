@@ -110,6 +110,44 @@ describe('Enhanced Signal Detector', () => {
       });
     });
 
+    test('should resolve repeated signals to the highest priority pattern', async () => {
+      const signals = await detector.detectSignals('[ff] first\n[ff] second\n[dp] progress');
+
+      expect(signals).toHaveLength(2);
+      expect(signals.find(s => s.type === 'ff')?.priority).toBe(10);
+      expect(signals.find(s => s.type === 'dp')?.data.category).toBe('development');
+    });
+
+    test('should assign unique ids to detected signals', async () => {
+      const signals = await detector.detectSignals('[dp] progress\n[tg] green\n[bf] fixed');
+
+      expect(new Set(signals.map(s => s.id)).size).toBe(signals.length);
+    });
+
+    test('should detect signals for a batch of texts in input order', async () => {
+      const results = await detector.detectSignalsBatch([
+        { content: '[dp] Development progress', source: 'first' },
+        { content: 'No signals here' },
+        { content: '[tg] Tests green', source: 'third' }
+      ]);
+
+      expect(results).toHaveLength(3);
+      expect(results[0].map(s => s.type)).toEqual(['dp']);
+      expect(results[0][0].source).toBe('first');
+      expect(results[1]).toHaveLength(0);
+      expect(results[2][0].timestamp).toBe(results[0][0].timestamp);
+    });
+
+    test('should yield signals lazily in content order', () => {
+      const iterator = detector.iterateSignals('[tg] Tests green\n[dp] Progress', 'lazy-test');
+
+      const first = iterator.next();
+      expect(first.done).toBe(false);
+      expect(first.value?.type).toBe('tg');
+      expect(first.value?.source).toBe('lazy-test');
+      expect(iterator.next().value?.type).toBe('dp');
+    });
+
     test('should detect all signal categories', async () => {
       const content = `
         # Development signals
@@ -265,6 +303,16 @@ describe('Enhanced Signal Detector', () => {
       expect(() => detector.setCategoryEnabled('testing', true)).not.toThrow();
     });
 
+    test('should only report enabled signals as present', () => {
+      expect(detector.hasSignals('[dp] Development progress')).toBe(true);
+      expect(detector.hasSignals('Plain text without signals')).toBe(false);
+
+      detector.setCategoryEnabled('development', false);
+      detector.setCategoryEnabled('design', false);
+
+      expect(detector.hasSignals('[dp] Development progress')).toBe(false);
+    });
+
     test('should get available categories', () => {
       const categories = detector.getCategories();
 
@@ -349,6 +397,16 @@ describe('Enhanced Signal Detector', () => {
       const signals2 = await detector.detectSignals(content);
 
       expect(signals1).toEqual(signals2);
+      expect(detector.getCacheStats().hitRate).toBe(0.5);
+    });
+
+    test('should keep cache entries for colon-containing sources apart', async () => {
+      const first = await detector.detectSignals('abc:fix [dp] Development progress', 'commit');
+      const second = await detector.detectSignals('fix [dp] Development progress', 'commit:abc');
+
+      expect(first[0].source).toBe('commit');
+      expect(second[0].source).toBe('commit:abc');
+      expect(detector.getCacheStats().hitRate).toBe(0);
     });
 
     test('should limit cache size', () => {
@@ -362,6 +420,7 @@ describe('Enhanced Signal Detector', () => {
     test('should handle empty content', async () => {
       const signals = await detector.detectSignals('');
       expect(signals).toHaveLength(0);
+      expect(detector.getCacheStats().size).toBe(0);
     });
 
     test('should handle content without signals', async () => {
@@ -0,0 +1,69 @@
+/**
+ * Unit Tests for Ephemeral Signal System signal logging
+ */
+
+import { EphemeralSignalSystem, EphemeralSignal } from '../../src/signals/ephemeral-signal-system';
+import { createLayerLogger } from '../../src/shared';
+
+// The logger is built inside the factory because the module under test creates it on import
+jest.mock('../../src/shared', () => {
+  const logger = {
+    debug: jest.fn(),
+    info: jest.fn(),
+    warn: jest.fn(),
+    error: jest.fn(),
+    isDebugEnabled: jest.fn(() => false)
+  };
+  return {
+    createLayerLogger: jest.fn(() => logger),
+    HashUtils: {
+      generateId: jest.fn(() => 'test-id')
+    }
+  };
+});
+
+const mockLogger = (createLayerLogger as jest.Mock)('orchestrator');
+
+const createSignal = (type: string): EphemeralSignal => ({
+  id: `${type}-signal`,
+  type,
+  timestamp: new Date(),
+  priority: 5,
+  source: 'test',
+  data: {},
+  ephemeral: false
+});
+
+const processedLogCalls = () =>
+  mockLogger.info.mock.calls.filter(([, message]: unknown[]) => String(message).startsWith('Processed '));
+
+describe('EphemeralSignalSystem signal log', () => {
+  let system: EphemeralSignalSystem;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    mockLogger.info.mockClear();
+    system = new EphemeralSignalSystem();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  test('should log a partial batch once the flush timer fires', () => {
+    system.processSignal(createSignal('[dp]'));
+    expect(processedLogCalls()).toHaveLength(0);
+
+    jest.runOnlyPendingTimers();
+
+    expect(processedLogCalls()).toHaveLength(1);
+    expect(processedLogCalls()[0][2]).toEqual({ byType: { '[dp]': 1 } });
+  });
+
+  test('should log emergency signals immediately', () => {
+    system.processSignal(createSignal('[AE]'));
+
+    expect(processedLogCalls()).toHaveLength(1);
+    expect(jest.getTimerCount()).toBe(0);
+  });
+});
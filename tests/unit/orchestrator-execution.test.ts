@@ -0,0 +1,131 @@
+/**
+ * Unit Tests for Orchestrator plan execution waves
+ */
+
+import { Orchestrator } from '../../src/orchestrator/orchestrator';
+import { ActionResult, ExecutionPlan, ExecutionStep } from '../../src/orchestrator/types';
+
+jest.mock('../../src/storage', () => ({
+  storageManager: {
+    getTokenState: jest.fn(() => ({})),
+    getAllPRPs: jest.fn(() => [])
+  }
+}));
+jest.mock('../../src/guidelines', () => ({
+  guidelinesRegistry: {
+    getEnabledGuidelines: jest.fn(() => [])
+  }
+}));
+
+const createStep = (id: string, overrides: Partial<ExecutionStep> = {}): ExecutionStep => ({
+  id,
+  name: id,
+  description: `Step ${id}`,
+  type: 'tool_call',
+  status: 'pending',
+  retryCount: 0,
+  maxRetries: 0,
+  ...overrides
+});
+
+const createPlan = (steps: ExecutionStep[], dependencies: Record<string, string[]> = {}): ExecutionPlan => ({
+  id: 'plan-1',
+  decisionId: 'decision-1',
+  steps,
+  dependencies: new Map(Object.entries(dependencies)),
+  status: 'pending',
+  progress: 0
+});
+
+describe('Orchestrator plan execution', () => {
+  let orchestrator: Orchestrator;
+
+  /** Stub executeStep so listed ids fail and every other step completes */
+  const stubExecuteStep = (failing: string[] = []) => {
+    jest.spyOn(orchestrator as any, 'executeStep').mockImplementation(async (...args: unknown[]) => {
+      const step = args[0] as ExecutionStep;
+      const failed = failing.includes(step.id);
+      step.status = failed ? 'failed' : 'completed';
+      const result: ActionResult = {
+        id: `result-${step.id}`,
+        actionId: step.id,
+        status: failed ? 'failed' : 'completed',
+        error: failed ? `${step.id} broke` : undefined,
+        startTime: new Date(),
+        duration: 0
+      };
+      return result;
+    });
+  };
+
+  /** Step ids of each non-empty wave executePlan started */
+  const recordWaves = () => {
+    const collect = jest.spyOn(orchestrator as any, 'collectReadySteps');
+    return () => collect.mock.results
+      .map(({ value }) => (value as ExecutionStep[]).map(step => step.id))
+      .filter(wave => wave.length > 0);
+  };
+
+  beforeEach(() => {
+    orchestrator = new Orchestrator();
+  });
+
+  test('should hold dependent steps until their parents complete', async () => {
+    stubExecuteStep();
+    const waves = recordWaves();
+    const plan = createPlan(
+      [createStep('a'), createStep('b'), createStep('c'), createStep('d')],
+      { c: ['a'], d: ['b', 'c'] }
+    );
+
+    await (orchestrator as any).executePlan(plan, 'decision-1');
+
+    expect(waves()).toEqual([['a', 'b'], ['c'], ['d']]);
+  });
+
+  test('should not run two agent tasks for the same assignee in one wave', () => {
+    const plan = createPlan([
+      createStep('a', { type: 'agent_task', assignedTo: 'developer' }),
+      createStep('b', { type: 'agent_task', assignedTo: 'developer' }),
+      createStep('c', { type: 'agent_task', assignedTo: 'tester' }),
+      createStep('d', { type: 'tool_call', assignedTo: 'developer' })
+    ]);
+
+    const ready: ExecutionStep[] = (orchestrator as any).collectReadySteps(plan);
+
+    expect(ready.map(step => step.id)).toEqual(['a', 'c', 'd']);
+  });
+
+  test('should run agent tasks for the same assignee in successive waves', async () => {
+    stubExecuteStep();
+    const waves = recordWaves();
+    const plan = createPlan([
+      createStep('a', { type: 'agent_task', assignedTo: 'developer' }),
+      createStep('b', { type: 'agent_task', assignedTo: 'developer' }),
+      createStep('c', { type: 'agent_task', assignedTo: 'tester' })
+    ]);
+
+    await (orchestrator as any).executePlan(plan, 'decision-1');
+
+    expect(waves()).toEqual([['a', 'c'], ['b']]);
+  });
+
+  test('should stop later waves after a critical step fails', async () => {
+    stubExecuteStep(['a']);
+    const waves = recordWaves();
+    const plan = createPlan(
+      [
+        createStep('a', { type: 'agent_task', assignedTo: 'developer' }),
+        createStep('b'),
+        createStep('c')
+      ],
+      { c: ['b'] }
+    );
+
+    await expect((orchestrator as any).executePlan(plan, 'decision-1')).rejects.toThrow('Critical step a failed: a broke');
+
+    expect(waves()).toEqual([['a', 'b']]);
+    expect(plan.steps[2].status).toBe('pending');
+    expect(plan.status).toBe('failed');
+  });
+});
@@ -15,6 +15,7 @@ jest.mock('../../src/shared/utils', () => ({
   })),
   HashUtils: {
     generateId: jest.fn(() => 'test-event-id'),
+    generateSequentialId: jest.fn(() => 'test-event-id'),
     hashString: jest.fn((str: string) => `hash-${str}`)
   },
   TimeUtils: {
@@ -0,0 +1,87 @@
+/**
+ * Unit Tests for Scanner PRP file scanning
+ */
+
+import { Scanner } from '../../src/scanner/scanner';
+
+jest.mock('chokidar', () => ({
+  watch: jest.fn(() => ({
+    on: jest.fn(),
+    close: jest.fn()
+  }))
+}));
+
+jest.mock('../../src/scanner/token-accounting', () => ({
+  TokenAccountingManager: jest.fn(() => ({
+    cleanup: jest.fn(() => Promise.resolve())
+  }))
+}));
+
+describe('Scanner PRP scanning', () => {
+  let scanner: Scanner;
+
+  beforeEach(() => {
+    scanner = new Scanner({ scanInterval: 60000 });
+    (scanner as any).worktreeMonitors.set('wt', { path: '/wt' });
+    (scanner as any).prpParsers.set('wt', {
+      worktreePath: '/wt',
+      cache: new Map(),
+      maxCacheSize: 1000,
+      cacheTimeout: 60000,
+      parseErrors: []
+    });
+  });
+
+  afterEach(async () => {
+    await scanner.shutdown();
+  });
+
+  test('should keep a bounded number of parses in flight and trim the cache once', async () => {
+    const prpFiles = Array(40).fill(0).map((_, i) => `/wt/PRPs/prp-${i}.md`);
+    jest.spyOn(scanner as any, 'findPRPFiles').mockResolvedValue(prpFiles);
+
+    // Every fourth file is slow; a finished read must hand its slot to the next file
+    // at once rather than wait for the slow ones, so sample in-flight reads each tick
+    let started = 0;
+    let inFlight = 0;
+    let maxInFlight = 0;
+    let minInFlightWhileQueued = Infinity;
+    jest.spyOn(scanner as any, 'parsePRPFile').mockImplementation(async (...args: unknown[]) => {
+      const path = args[1] as string;
+      const ticks = prpFiles.indexOf(path) % 4 === 0 ? 10 : 1;
+      started++;
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      for (let tick = 0; tick < ticks; tick++) {
+        await new Promise(resolve => setImmediate(resolve));
+        if (started < prpFiles.length) {
+          minInFlightWhileQueued = Math.min(minInFlightWhileQueued, inFlight);
+        }
+      }
+      inFlight--;
+      return { path };
+    });
+    const trimParserCache = jest.spyOn(scanner as any, 'trimParserCache');
+
+    const updates = await (scanner as any).scanPRPFiles('wt');
+
+    expect(maxInFlight).toBe(16);
+    expect(minInFlightWhileQueued).toBe(16);
+    expect(updates.map((update: { path: string }) => update.path)).toEqual(prpFiles);
+    expect(trimParserCache).toHaveBeenCalledTimes(1);
+  });
+
+  test('should evict the oldest entries down to 80% of the cache limit', () => {
+    const parser = (scanner as any).prpParsers.get('wt');
+    parser.maxCacheSize = 10;
+    for (let i = 0; i < 14; i++) {
+      parser.cache.set(`/wt/PRPs/prp-${i}.md`, { lastModified: new Date(2024, 0, i + 1) });
+    }
+
+    (scanner as any).trimParserCache(parser);
+
+    expect(Array.from(parser.cache.keys())).toEqual(
+      Array(8).fill(0).map((_, i) => `/wt/PRPs/prp-${i + 6}.md`)
+    );
+  });
+});